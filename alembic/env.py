@@ -13,7 +13,7 @@ from app.models.run import Run
 from app.models.run_event import RunEvent
 from app.models.field_map import FieldMap
 from app.models.record import Record
-from app.models.session import SessionVault
+from app.models.session import SessionVault, SessionVaultLocalStorage
 from app.models.api_key_usage import ApiKeyUsage
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,62 @@
+"""session_vault_lz4_compression
+
+Revision ID: 5e0c8a7d4f12
+Revises: b3d91f6a2c47
+Create Date: 2026-10-16 22:24:10.000000
+
+LZ4 TOAST compression for the large session_data / validation_attempts
+JSONB (Postgres 14+). SET COMPRESSION only applies to values written
+afterwards, so existing pglz values are rebuilt once here.
+
+The server-wide default for other columns belongs in postgresql.conf
+(default_toast_compression = lz4); docker-compose.yml passes it to the
+dev database.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0c8a7d4f12'
+down_revision: Union[str, None] = 'b3d91f6a2c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ('session_data', 'validation_attempts')
+
+
+def _supported() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.server_version_info < (14,):
+        return False
+    columns = {c['name'] for c in sa.inspect(bind).get_columns('session_vaults')}
+    return all(name in columns for name in _COLUMNS)
+
+
+def upgrade() -> None:
+    if not _supported():
+        return
+
+    for name in _COLUMNS:
+        op.execute(f"ALTER TABLE session_vaults ALTER COLUMN {name} SET COMPRESSION lz4")
+
+    # VACUUM FULL and no-op UPDATEs copy compressed values as they are; the
+    # text round trip builds a fresh datum. Only pglz rows are touched, so
+    # values already on LZ4 (or too small to compress) aren't rewritten.
+    op.execute("""
+        UPDATE session_vaults
+        SET session_data = session_data::text::jsonb,
+            validation_attempts = validation_attempts::text::jsonb
+        WHERE pg_column_compression(session_data) = 'pglz'
+            OR pg_column_compression(validation_attempts) = 'pglz'
+    """)
+
+
+def downgrade() -> None:
+    if not _supported():
+        return
+
+    # Existing LZ4 values stay readable; only new writes go back to pglz
+    for name in _COLUMNS:
+        op.execute(f"ALTER TABLE session_vaults ALTER COLUMN {name} SET COMPRESSION default")
@@ -0,0 +1,57 @@
+"""session_vault_one_valid_per_domain
+
+Revision ID: 7c4a2e91b8f0
+Revises: d82f1b6e9a35
+Create Date: 2026-10-16 22:27:45.000000
+
+Partial unique index on session_vaults(domain) WHERE is_valid. Session
+capture upserts with ON CONFLICT (domain) WHERE is_valid, which Postgres
+rejects unless this index exists. Older duplicate valid sessions (all but
+the most recently validated per domain) are invalidated first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4a2e91b8f0'
+down_revision: Union[str, None] = 'd82f1b6e9a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('session_vaults')}
+    # domain / is_valid come from the HITL SQL migration
+    if not {'domain', 'is_valid'} <= columns:
+        return
+
+    op.execute("""
+        UPDATE session_vaults sv
+        SET is_valid = FALSE,
+            health_status = 'invalid'
+        FROM (
+            SELECT id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY domain
+                       ORDER BY last_validated DESC NULLS LAST, captured_at DESC NULLS LAST
+                   ) AS rn
+            FROM session_vaults
+            WHERE is_valid
+        ) ranked
+        WHERE sv.id = ranked.id
+            AND ranked.rn > 1
+    """)
+    op.create_index(
+        'uq_session_vaults_domain_valid',
+        'session_vaults',
+        ['domain'],
+        unique=True,
+        postgresql_where=sa.text('is_valid'),
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_session_vaults_domain_valid', table_name='session_vaults', if_exists=True)
@@ -0,0 +1,78 @@
+"""session_vault_timestamptz
+
+Revision ID: b3d91f6a2c47
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-16 22:20:57.000000
+
+captured_at / last_validated / expires_at become TIMESTAMPTZ filled by
+now(), and validation_attempts defaults to '[]' on the server. The naive
+values were written as UTC, so they are converted AT TIME ZONE 'UTC'.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d91f6a2c47'
+down_revision: Union[str, None] = 'f1a2b3c4d5e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMPS = ('captured_at', 'last_validated', 'expires_at')
+
+
+def _columns() -> dict:
+    return {c['name']: c for c in sa.inspect(op.get_bind()).get_columns('session_vaults')}
+
+
+def upgrade() -> None:
+    columns = _columns()
+    # The lifecycle columns come from the HITL SQL migration; nothing to
+    # convert on a database that never had them
+    if not all(name in columns for name in _TIMESTAMPS):
+        return
+
+    for name in _TIMESTAMPS:
+        if not columns[name]['type'].timezone:
+            op.alter_column(
+                'session_vaults', name,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                postgresql_using=f"{name} AT TIME ZONE 'UTC'"
+            )
+
+    op.execute("UPDATE session_vaults SET captured_at = now() WHERE captured_at IS NULL")
+    op.execute("UPDATE session_vaults SET last_validated = now() WHERE last_validated IS NULL")
+    op.alter_column('session_vaults', 'captured_at',
+                    existing_type=sa.DateTime(timezone=True),
+                    server_default=sa.text('now()'),
+                    nullable=False)
+    op.alter_column('session_vaults', 'last_validated',
+                    existing_type=sa.DateTime(timezone=True),
+                    server_default=sa.text('now()'),
+                    nullable=False)
+    op.alter_column('session_vaults', 'validation_attempts',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    server_default=sa.text("'[]'::jsonb"))
+
+
+def downgrade() -> None:
+    columns = _columns()
+    if not all(name in columns for name in _TIMESTAMPS):
+        return
+
+    for name in _TIMESTAMPS:
+        op.alter_column(
+            'session_vaults', name,
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.DateTime(),
+            postgresql_using=f"{name} AT TIME ZONE 'UTC'"
+        )
+    op.alter_column('session_vaults', 'captured_at',
+                    existing_type=sa.DateTime(),
+                    nullable=True)
+    op.alter_column('session_vaults', 'last_validated',
+                    existing_type=sa.DateTime(),
+                    nullable=True)
@@ -0,0 +1,57 @@
+"""session_vault_local_storage
+
+Revision ID: d82f1b6e9a35
+Revises: 5e0c8a7d4f12
+Create Date: 2026-10-16 22:25:32.000000
+
+Move localStorage out of session_vaults.session_data into a 1:1 side
+table, so session fetches and probes only move the small hot fields.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd82f1b6e9a35'
+down_revision: Union[str, None] = '5e0c8a7d4f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('session_vault_local_storage'):
+        op.create_table('session_vault_local_storage',
+        sa.Column('session_id', sa.UUID(), nullable=False),
+        sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.ForeignKeyConstraint(['session_id'], ['session_vaults.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('session_id')
+        )
+    if bind.dialect.server_version_info >= (14,):
+        op.execute("ALTER TABLE session_vault_local_storage ALTER COLUMN data SET COMPRESSION lz4")
+
+    op.execute("""
+        INSERT INTO session_vault_local_storage (session_id, data)
+        SELECT id, session_data->'local_storage'
+        FROM session_vaults
+        WHERE session_data ? 'local_storage'
+            AND jsonb_typeof(session_data->'local_storage') <> 'null'
+        ON CONFLICT (session_id) DO NOTHING
+    """)
+    op.execute("""
+        UPDATE session_vaults
+        SET session_data = session_data - 'local_storage'
+        WHERE session_data ? 'local_storage'
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        UPDATE session_vaults sv
+        SET session_data = sv.session_data || jsonb_build_object('local_storage', ls.data)
+        FROM session_vault_local_storage ls
+        WHERE ls.session_id = sv.id
+    """)
+    op.drop_table('session_vault_local_storage')
@@ -10,13 +10,15 @@ Endpoints:
 
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, text
+from sqlalchemy.dialects.postgresql import insert
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from app.database import SessionLocal
 from app.models.intervention import InterventionTask
-from app.models.session import SessionVault
+from app.models.session import SessionVault, SessionVaultLocalStorage
 from app.models.run import Run
 from app.services.orchestrator import resume_run
 from app.services.event_emitter import emit_intervention_resolved
@@ -138,18 +140,51 @@ def resolve_intervention(
         domain = intervention.payload.get("domain")
         
         if domain:
-            session = SessionVault(
-                id=str(uuid.uuid4()),
+            # Split the cold localStorage blob into its side table
+            session_data = dict(request.captured_session)
+            local_storage = session_data.pop("local_storage", None)
+            
+            # Upsert against the one-valid-session-per-domain index
+            stmt = insert(SessionVault).values(
+                id=uuid.uuid4(),
                 domain=domain,
-                session_data=request.captured_session,
-                captured_at=datetime.utcnow(),
-                last_validated=datetime.utcnow(),
+                session_data=session_data,
                 is_valid=True,
                 health_status="valid",
                 intervention_id=uuid.UUID(intervention_id),
                 notes=f"Captured via intervention resolution: {intervention.trigger_reason}"
             )
-            db.add(session)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SessionVault.domain],
+                index_where=text("is_valid"),
+                set_={
+                    "session_data": stmt.excluded.session_data,
+                    "health_status": stmt.excluded.health_status,
+                    "intervention_id": stmt.excluded.intervention_id,
+                    "notes": stmt.excluded.notes,
+                    # A re-capture starts a fresh lifecycle: no inherited
+                    # expiry or failure history (EXCLUDED carries the defaults)
+                    "expires_at": stmt.excluded.expires_at,
+                    "validation_attempts": stmt.excluded.validation_attempts,
+                    "captured_at": func.now(),
+                    "last_validated": func.now()
+                }
+            ).returning(SessionVault.id)
+            session_id = db.execute(stmt).scalar_one()
+            
+            if local_storage:
+                ls_stmt = insert(SessionVaultLocalStorage).values(
+                    session_id=session_id,
+                    data=local_storage
+                )
+                db.execute(ls_stmt.on_conflict_do_update(
+                    index_elements=[SessionVaultLocalStorage.session_id],
+                    set_={"data": ls_stmt.excluded.data}
+                ))
+            else:
+                db.execute(delete(SessionVaultLocalStorage).where(
+                    SessionVaultLocalStorage.session_id == session_id
+                ))
     
     db.commit()
     
@@ -13,7 +13,7 @@ from app.models.record import Record
 from app.models.field_map import FieldMap
 from app.models.session import SessionVault
 from app.schemas.job import JobCreate, JobRead
-from app.schemas.run import RunRead, RunEventRead
+from app.schemas.run import RunRead, RunEventRead, RUN_EVENTS_ADAPTER
 from app.schemas.preview import PreviewRequest, PreviewResponse, SelectorValidateRequest, SelectorValidateResponse
 from app.schemas.field_map import FieldMapRead, FieldMapUpsert, FieldMapBulkUpsert
 from app.schemas.list_wizard import ListWizardValidateRequest, ListWizardValidateResponse
@@ -131,7 +131,7 @@ async def create_job_run(job_id: str):
             failure_code=run.failure_code,
             error_message=run.error_message,
             stats=run.stats or {},
-            engine_attempts=run.engine_attempts or [],
+            engine_attempts=run.engine_attempts or (),
             created_at=run.created_at.isoformat(),
             started_at=run.started_at.isoformat() if run.started_at else None,
             finished_at=run.finished_at.isoformat() if run.finished_at else None,
@@ -163,7 +163,7 @@ def list_job_runs(job_id: str, limit: int = 25):
                 failure_code=r.failure_code,
                 error_message=r.error_message,
                 stats=r.stats or {},
-                engine_attempts=r.engine_attempts or [],
+                engine_attempts=r.engine_attempts or (),
                 created_at=r.created_at.isoformat(),
                 started_at=r.started_at.isoformat() if r.started_at else None,
                 finished_at=r.finished_at.isoformat() if r.finished_at else None,
@@ -202,7 +202,7 @@ def list_all_runs(limit: int = 50, job_id: str = None, status: str = None):
                 failure_code=r.failure_code,
                 error_message=r.error_message,
                 stats=r.stats or {},
-                engine_attempts=r.engine_attempts or [],
+                engine_attempts=r.engine_attempts or (),
                 created_at=r.created_at.isoformat(),
                 started_at=r.started_at.isoformat() if r.started_at else None,
                 finished_at=r.finished_at.isoformat() if r.finished_at else None,
@@ -251,17 +251,17 @@ def get_run_events(run_id: str, limit: int = 200):
             .limit(min(limit, 1000))
             .all()
         )
-        return [
-            RunEventRead(
-                id=str(e.id),
-                run_id=str(e.run_id),
-                level=e.level,
-                message=e.message,
-                meta=e.meta or {},
-                created_at=e.created_at.isoformat(),
-            )
+        return RUN_EVENTS_ADAPTER.validate_python([
+            {
+                "id": str(e.id),
+                "run_id": str(e.run_id),
+                "level": e.level,
+                "message": e.message,
+                "meta": e.meta or {},
+                "created_at": e.created_at.isoformat(),
+            }
             for e in events
-        ]
+        ])
     finally:
         db.close()
 
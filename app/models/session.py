@@ -9,9 +9,10 @@ Architecture:
 """
 
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.database import Base
 
 
@@ -29,6 +30,16 @@ class SessionVault(Base):
     Never hard-code credentials. Always capture via intervention flow.
     """
     __tablename__ = "session_vaults"
+    __table_args__ = (
+        # At most one valid session per domain; lookups hit this index and
+        # captures upsert against it instead of checking in Python
+        Index(
+            "uq_session_vaults_domain_valid",
+            "domain",
+            unique=True,
+            postgresql_where=text("is_valid")
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -41,15 +52,17 @@ class SessionVault(Base):
     #   "cookies": [{"name": "session_id", "value": "...", "domain": "..."}],
     #   "headers": {"Authorization": "Bearer ..."},
     #   "user_agent": "...",
-    #   "local_storage": {...},
     #   "captured_method": "manual_export" | "playwright_capture" | "provider"
     # }
+    # localStorage lives in SessionVaultLocalStorage so probes and lookups
+    # only move the small hot fields.
     session_data = Column(JSONB, nullable=False)
     
     # Lifecycle tracking
-    captured_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    last_validated = Column(DateTime, nullable=False, default=datetime.utcnow)
-    expires_at = Column(DateTime, nullable=True)  # Estimated expiration
+    captured_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    # Last successful validation; stamped explicitly, not on every UPDATE
+    last_validated = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # Estimated expiration
     
     # Health status
     is_valid = Column(Boolean, default=True)
@@ -60,5 +73,30 @@ class SessionVault(Base):
     
     # Metadata
     notes = Column(String, nullable=True)
-    validation_attempts = Column(JSONB, default=list)  # History of probe attempts
+    validation_attempts = Column(JSONB, server_default=text("'[]'::jsonb"))  # History of probe attempts
     # Example: [{"timestamp": "...", "status": "valid", "response_code": 200}]
+    
+    # Cold localStorage blob, loaded only when accessed
+    local_storage = relationship(
+        "SessionVaultLocalStorage",
+        uselist=False,
+        lazy="select",
+        cascade="all, delete-orphan"
+    )
+
+
+class SessionVaultLocalStorage(Base):
+    """
+    localStorage captured alongside a session (1:1 with SessionVault).
+    
+    Kept out of session_vaults so the large, rarely-read blob doesn't ride
+    along on every session fetch.
+    """
+    __tablename__ = "session_vault_local_storage"
+
+    session_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("session_vaults.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    data = Column(JSONB, nullable=False)
@@ -5,7 +5,19 @@ Real selectors for FastPeopleSearch and TruePeopleSearch.
 These are free sites with no authentication required.
 """
 
-from typing import Dict, Any
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Optional, Tuple
+
+from app.scraping.extraction import compile_css
+
+
+# SmartFields config shared by every phone field (one object, not one per field)
+_US_E164 = {"country": "US", "format": "E164"}
 
 
 # FastPeopleSearch Configuration
@@ -49,7 +61,7 @@ FAST_PEOPLE_SEARCH = {
             "phone": {
                 "css": "div.card-body .phones a",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "city": {
                 "css": "div.card-body .detail-box-address .city",
@@ -83,7 +95,7 @@ FAST_PEOPLE_SEARCH = {
             "phone": {
                 "css": "div.phones a",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "div.current-address",
@@ -110,7 +122,7 @@ FAST_PEOPLE_SEARCH = {
                 "css": "div.phones-table tbody tr td:first-child",
                 "field_type": "phone",
                 "all": True,
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "phone_types": {
                 "css": "div.phones-table tbody tr td:nth-child(2)",
@@ -184,7 +196,7 @@ TRUE_PEOPLE_SEARCH = {
             "phone": {
                 "css": "div.card .content-label:contains('Phone') + .content-value a",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "div.card .content-label:contains('Address') + .content-value",
@@ -210,7 +222,7 @@ TRUE_PEOPLE_SEARCH = {
             "phone": {
                 "css": "div.content-label:contains('Phone') + .content-value",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "div.content-label:contains('Current Address') + .content-value",
@@ -237,7 +249,7 @@ TRUE_PEOPLE_SEARCH = {
                 "css": "div.content-label:contains('Phone Numbers') + .content-value div.row div",
                 "field_type": "phone",
                 "all": True,
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "phone_types": {
                 "css": "div.content-label:contains('Phone Numbers') + .content-value div.row small",
@@ -297,7 +309,7 @@ THATS_THEM = {
                 "css": "div.phone span.number a.web",
                 "all": True,
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "city": {
                 "css": "span.address span.city",
@@ -341,7 +353,7 @@ THATS_THEM = {
             "phone": {
                 "css": "div.phone span.number a.web",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "div.subtitle:contains('Current Address:') ~ div.location span.address a.web",
@@ -379,7 +391,7 @@ ANY_WHO = {
                 "css": "a[href*='phone'], div[class*='phone'], span[class*='phone']",
                 "all": True,
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "div[class*='address'], p[class*='address'], span[class*='address']",
@@ -406,7 +418,7 @@ ANY_WHO = {
             "phone": {
                 "css": "a[href*='phone'], div[class*='phone']",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "div[class*='address'], p[class*='address']",
@@ -453,7 +465,7 @@ SEARCH_PEOPLE_FREE = {
                 "css": "ul.inline.current a[href*='phone-lookup']",
                 "all": True,
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "address a",
@@ -485,7 +497,7 @@ SEARCH_PEOPLE_FREE = {
             "phone": {
                 "css": "ul.inline.current a[href*='phone-lookup']",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "address a",
@@ -522,7 +534,7 @@ ZABA_SEARCH = {
                 "css": "div.section-box h3:contains('Associated Phone Numbers') + ul.showMore-list li a",
                 "all": True,
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "email": {
                 "css": "div.section-box h3:contains('Associated Email Addresses') + ul.showMore-list li",
@@ -553,7 +565,7 @@ ZABA_SEARCH = {
             "phone": {
                 "css": "div.section-box h3:contains('Associated Phone Numbers') + ul.showMore-list li a",
                 "field_type": "phone",
-                "smart_config": {"country": "US", "format": "E164"}
+                "smart_config": _US_E164
             },
             "address": {
                 "css": "div.section-box h3:contains('Last Known Address') ~ div.flex p",
@@ -575,14 +587,233 @@ PEOPLE_SEARCH_SITES = {
 }
 
 
-def get_site_config(site_name: str) -> Dict[str, Any]:
-    """Get configuration for a people search site"""
-    site = PEOPLE_SEARCH_SITES.get(site_name.lower())
-    if not site:
+SEARCH_TYPES = ("search_by_name", "search_by_phone", "person_details")
+
+
+@lru_cache(maxsize=None)
+def compile_url_template(template: str) -> Callable[[Dict[str, str]], str]:
+    """
+    Compile a URL template into a builder that takes already-formatted values.
+    
+    The template is tokenized once and turned into the source of a single
+    f-string, so building a URL is one function call with no parsing or
+    per-segment loop. Placeholders without a value are left as "{key}".
+    """
+    body = []
+    # Placeholder keys/defaults are bound as globals of the generated code so
+    # the f-string expressions never need quoting
+    namespace: Dict[str, Any] = {}
+    for literal, field, _, _ in Formatter().parse(template):
+        if literal:
+            body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is not None:
+            i = len(namespace) // 2
+            namespace[f"_k{i}"] = field
+            namespace[f"_d{i}"] = "{" + field + "}"
+            body.append(f"{{get(_k{i}, _d{i})}}")
+    source = (
+        "def build(values):\n"
+        "    get = values.get\n"
+        f"    return f{''.join(body)!r}\n"
+    )
+    exec(compile(source, f"<url_template {template!r}>", "exec"), namespace)
+    return namespace["build"]
+
+
+def _compile_site(cfg: Dict[str, Any]) -> None:
+    """Attach precompiled helpers to each search config of a site."""
+    for search_type in SEARCH_TYPES:
+        search_config = cfg.get(search_type)
+        if search_config:
+            search_config["_url_fn"] = compile_url_template(search_config["url_template"])
+            
+            # Fields and list_config are persisted on Job as JSON (css
+            # only), so only warm the selector cache
+            for spec in search_config["fields"].values():
+                compile_css(spec["css"])
+            for spec in search_config.get("list_config", {}).values():
+                if isinstance(spec, dict) and spec.get("css"):
+                    compile_css(spec["css"])
+
+
+for _cfg in PEOPLE_SEARCH_SITES.values():
+    _compile_site(_cfg)
+
+
+@dataclass(slots=True, frozen=True)
+class FieldSpec:
+    """One field of a search mode, validated at import."""
+    css: str
+    attr: Optional[str]
+    field_type: str
+    all: bool
+    regex: Optional[str]
+    smart_config: Optional[Dict[str, Any]]
+    validation_rules: Optional[Dict[str, Any]]
+    
+    def selector_spec(self) -> Dict[str, Any]:
+        """Selector spec as stored on FieldMap"""
+        spec = {"css": self.css, "attr": self.attr, "all": self.all}
+        if self.regex:
+            spec["regex"] = self.regex
+        return spec
+
+
+@dataclass(slots=True, frozen=True)
+class SiteMode:
+    """One search mode of a site (search_by_name / search_by_phone / person_details)."""
+    url_template: str
+    url_fn: Callable[[Dict[str, str]], str]
+    crawl_mode: str
+    engine_mode: str
+    list_config: Dict[str, Any]
+    fields: Dict[str, FieldSpec]
+
+
+@dataclass(slots=True, frozen=True)
+class SiteConfig:
+    """Typed view of a site configuration dict."""
+    name: str
+    base_url: str
+    free: bool
+    requires_auth: bool
+    search_by_name: Optional[SiteMode]
+    search_by_phone: Optional[SiteMode]
+    person_details: Optional[SiteMode]
+    
+    def mode(self, search_type: str) -> Optional[SiteMode]:
+        """Search mode by name, or None if the site doesn't support it"""
+        if search_type not in SEARCH_TYPES:
+            return None
+        return getattr(self, search_type)
+
+
+def _build_field_spec(raw: Dict[str, Any]) -> FieldSpec:
+    return FieldSpec(
+        css=raw["css"],
+        attr=raw.get("attr"),
+        field_type=raw.get("field_type", "string"),
+        all=raw.get("all", False),
+        regex=raw.get("regex"),
+        smart_config=raw.get("smart_config"),
+        validation_rules=raw.get("validation_rules")
+    )
+
+
+def _build_site_mode(raw: Optional[Dict[str, Any]]) -> Optional[SiteMode]:
+    if not raw:
+        return None
+    return SiteMode(
+        url_template=raw["url_template"],
+        url_fn=raw["_url_fn"],
+        crawl_mode=raw.get("crawl_mode", "single"),
+        engine_mode=raw.get("engine_mode", "auto"),
+        list_config=raw.get("list_config", {}),
+        fields={name: _build_field_spec(f) for name, f in raw["fields"].items()}
+    )
+
+
+def _build_site_config(raw: Dict[str, Any]) -> SiteConfig:
+    return SiteConfig(
+        name=raw["name"],
+        base_url=raw["base_url"],
+        free=raw.get("free", True),
+        requires_auth=raw.get("requires_auth", False),
+        search_by_name=_build_site_mode(raw.get("search_by_name")),
+        search_by_phone=_build_site_mode(raw.get("search_by_phone")),
+        person_details=_build_site_mode(raw.get("person_details"))
+    )
+
+
+class SiteId(IntEnum):
+    """Integer handle for a site; index into _CONFIGS."""
+    FASTPEOPLESEARCH = 0
+    TRUEPEOPLESEARCH = 1
+    THATSTHEM = 2
+    ANYWHO = 3
+    SEARCHPEOPLEFREE = 4
+    ZABASEARCH = 5
+
+
+# Dense tuple in SiteId order, so dispatch by id is a plain index
+_CONFIGS = (
+    FAST_PEOPLE_SEARCH,
+    TRUE_PEOPLE_SEARCH,
+    THATS_THEM,
+    ANY_WHO,
+    SEARCH_PEOPLE_FREE,
+    ZABA_SEARCH
+)
+
+# Typed configs, built (and validated) once at import, in SiteId order
+_SPECS = tuple(_build_site_config(cfg) for cfg in _CONFIGS)
+
+
+def _freeze(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Recursively wrap dicts in read-only proxies with interned keys.
+    
+    Sub-dicts shared between sites (e.g. _US_E164) are frozen
+    once and stay shared.
+    """
+    if not isinstance(value, dict):
+        return value
+    if memo is None:
+        memo = {}
+    frozen = memo.get(id(value))
+    if frozen is None:
+        frozen = memo[id(value)] = MappingProxyType({
+            (sys.intern(k) if isinstance(k, str) else k): _freeze(v, memo)
+            for k, v in value.items()
+        })
+    return frozen
+
+
+# Everything derived from the raw dicts is built above; from here on the
+# registry is read-only and can be shared across worker threads as-is
+PEOPLE_SEARCH_SITES = _freeze(PEOPLE_SEARCH_SITES)
+_CONFIGS = tuple(PEOPLE_SEARCH_SITES[site_id.name.lower()] for site_id in SiteId)
+(
+    FAST_PEOPLE_SEARCH,
+    TRUE_PEOPLE_SEARCH,
+    THATS_THEM,
+    ANY_WHO,
+    SEARCH_PEOPLE_FREE,
+    ZABA_SEARCH
+) = _CONFIGS
+
+_NAME_TO_ID = {name: SiteId[name.upper()] for name in PEOPLE_SEARCH_SITES}
+
+
+def resolve_site_id(site_name: str) -> SiteId:
+    """Resolve a site name to its SiteId (once per job submission)"""
+    site_id = _NAME_TO_ID.get(site_name)
+    if site_id is None:
+        site_id = _NAME_TO_ID.get(site_name.lower())
+    if site_id is None:
         raise ValueError(f"Unknown people search site: {site_name}")
-    return site
+    return site_id
+
+
+def get_site_config_by_id(site_id: SiteId) -> Mapping[str, Any]:
+    """Get configuration for a people search site by SiteId"""
+    return _CONFIGS[site_id]
+
 
+def get_site_spec_by_id(site_id: SiteId) -> SiteConfig:
+    """Get the typed configuration for a people search site by SiteId"""
+    return _SPECS[site_id]
 
-def get_available_sites() -> list:
+
+@lru_cache(maxsize=32)
+def get_site_config(site_name: str) -> Mapping[str, Any]:
+    """Get configuration for a people search site (configs are read-only, so memoized)"""
+    return _CONFIGS[resolve_site_id(site_name)]
+
+
+def get_available_sites() -> Tuple[str, ...]:
     """Get list of available people search sites"""
-    return list(PEOPLE_SEARCH_SITES.keys())
+    return _AVAILABLE_SITES
+
+
+_AVAILABLE_SITES = tuple(PEOPLE_SEARCH_SITES.keys())
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Any, Optional, List
 
 
@@ -20,6 +20,8 @@ class FieldMapBulkUpsert(BaseModel):
 
 class FieldMapRead(FieldMapUpsert):
     """Schema for reading field maps"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     job_id: str
     created_at: str
@@ -1,19 +1,23 @@
 """Pydantic schemas for HITL intervention tasks"""
 
-from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Any, Literal, Optional, List
+from app.schemas.types import JSONObject
 
 
 class InterventionTaskRead(BaseModel):
     """Read schema for intervention tasks"""
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     job_id: str
     run_id: Optional[str] = None
     type: str
     status: str
     trigger_reason: str
-    payload: Dict[str, Any]
-    resolution: Optional[Dict[str, Any]] = None
+    payload: JSONObject
+    resolution: Optional[JSONObject] = None
     priority: str
     expires_at: Optional[str] = None
     created_at: str
@@ -29,7 +33,7 @@ class InterventionResolveRequest(BaseModel):
 
 class InterventionListFilter(BaseModel):
     """Filter options for listing intervention tasks"""
-    status: Optional[str] = None  # pending | in_progress | completed | expired
-    type: Optional[str] = None    # selector_fix | field_confirm | login_refresh | manual_access
-    priority: Optional[str] = None  # low | normal | high | critical
+    status: Optional[Literal["pending", "in_progress", "completed", "expired", "cancelled", "resolved"]] = None
+    type: Optional[Literal["selector_fix", "field_confirm", "login_refresh", "manual_access"]] = None
+    priority: Optional[Literal["low", "normal", "high", "critical"]] = None
     job_id: Optional[str] = None
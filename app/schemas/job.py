@@ -1,24 +1,27 @@
-from pydantic import BaseModel, HttpUrl, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional, Dict, Any
 from app.enums import ExecutionStrategy
+from app.schemas.url import HttpUrlStr
 
 
 class JobCreate(BaseModel):
-    target_url: HttpUrl
+    target_url: HttpUrlStr
     fields: List[str] = Field(..., min_length=1)
     requires_auth: bool = False
     frequency: Optional[str] = "on_demand"
     strategy: ExecutionStrategy = ExecutionStrategy.AUTO
 
     # Step Four
-    crawl_mode: str = Field(default="single", pattern="^(single|list)$")
+    crawl_mode: Literal["single", "list"] = "single"
     list_config: Dict[str, Any] = Field(default_factory=dict)
 
     # Auto-escalation engine
-    engine_mode: str = Field(default="auto", pattern="^(auto|http|playwright|provider)$")
+    engine_mode: Literal["auto", "http", "playwright", "provider"] = "auto"
     browser_profile: Dict[str, Any] = Field(default_factory=dict)
 
 
 class JobRead(JobCreate):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     status: str
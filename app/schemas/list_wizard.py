@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, Tuple
 
 
 class ListWizardValidateRequest(BaseModel):
@@ -11,9 +11,11 @@ class ListWizardValidateRequest(BaseModel):
 
 
 class ListWizardValidateResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     url: str
     fetched_via: str
     item_count_estimate: int
-    sample_item_urls: List[str]
+    sample_item_urls: Tuple[str, ...]
     next_page_url: Optional[str] = None
-    warnings: List[str] = []
+    warnings: Tuple[str, ...] = ()
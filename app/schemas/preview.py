@@ -1,9 +1,10 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
+from app.schemas.url import HttpUrlStr
 
 
 class PreviewRequest(BaseModel):
-    url: HttpUrl
+    url: HttpUrlStr
     prefer_browser: bool = False
 
 
@@ -15,7 +16,7 @@ class PreviewResponse(BaseModel):
 
 
 class SelectorValidateRequest(BaseModel):
-    url: HttpUrl
+    url: HttpUrlStr
     selector_spec: Dict[str, Any]
     prefer_browser: bool = False
 
@@ -1,8 +1,14 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Optional, List, Tuple
+from app.schemas.types import JSONObject
 
 
 class RunRead(BaseModel):
+    # Pydantic keeps field values in __dict__, so only the __weakref__
+    # slot can be dropped; these are built once per streamed row
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     job_id: str
 
@@ -16,17 +22,24 @@ class RunRead(BaseModel):
     failure_code: Optional[str] = None
     error_message: Optional[str] = None
 
-    stats: Dict[str, Any]
-    engine_attempts: List[Dict[str, Any]] = []
+    stats: JSONObject
+    engine_attempts: Tuple[JSONObject, ...] = ()
     created_at: str
     started_at: Optional[str] = None
     finished_at: Optional[str] = None
 
 
 class RunEventRead(BaseModel):
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     run_id: str
     level: str
     message: str
-    meta: Dict[str, Any]
+    meta: JSONObject
     created_at: str
+
+
+# Bulk decode for event lists (one core-validator call instead of N constructors)
+RUN_EVENTS_ADAPTER = TypeAdapter(List[RunEventRead])
@@ -0,0 +1,10 @@
+"""Shared field types for read schemas"""
+
+from typing import Any, Dict
+
+from pydantic import SkipValidation
+
+# JSON object that already came out of a JSONB column (or the engine that
+# wrote it). Passed through without per-key validation; still documented as
+# "object" in the OpenAPI schema.
+JSONObject = SkipValidation[Dict[str, Any]]
@@ -0,0 +1,22 @@
+"""Shared URL field type for request/read schemas"""
+
+from functools import lru_cache
+from typing import Annotated
+
+from pydantic import AfterValidator, HttpUrl, TypeAdapter
+
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+@lru_cache(maxsize=8192)
+def _validate_url(url: str) -> str:
+    """
+    Validate and canonicalize an http(s) URL with HttpUrl, memoized.
+
+    The same target URL is posted repeatedly (preview -> validate -> create,
+    re-runs), and JobRead re-validates every stored URL on list endpoints.
+    """
+    return str(_HTTP_URL_ADAPTER.validate_python(url))
+
+
+HttpUrlStr = Annotated[str, AfterValidator(_validate_url)]
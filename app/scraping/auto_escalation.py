@@ -5,23 +5,63 @@ Deterministic rules for when to escalate from HTTP → Playwright → Provider.
 """
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
+from functools import lru_cache
 import re
+import time
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+
+@lru_cache(maxsize=64)
+def _utc_iso_seconds(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _utc_iso(ts_ns: int) -> str:
+    """
+    time.time_ns() as datetime.now(timezone.utc).isoformat() would print it.
+
+    The date/time part is cached per second, so stamping a burst of
+    attempts is string formatting rather than a datetime per call.
+    """
+    seconds, ns = divmod(ts_ns, 1_000_000_000)
+    micros = ns // 1000
+    if micros:
+        return f"{_utc_iso_seconds(seconds)}.{micros:06d}+00:00"
+    return f"{_utc_iso_seconds(seconds)}+00:00"
+
+
+def _ascii_lower(text: str) -> bytes:
+    return text.encode('latin-1', 'replace').lower()
 
 
 class EscalationSignal:
     """Signals that trigger escalation."""
     
-    # JS Framework markers (HTTP → Playwright)
+    # JS Framework markers (HTTP → Playwright): (literal needle, signal),
+    # matched case-insensitively. Each needle identifies its framework on
+    # its own, wherever it appears in the page.
     JS_MARKERS = [
-        r'<script[^>]*id=["\']__NEXT_DATA__["\']',  # Next.js
-        r'data-reactroot',  # React
-        r'data-react-helmet',  # React Helmet
-        r'ng-version',  # Angular
-        r'v-cloak',  # Vue.js
-        r'<div[^>]*id=["\']app["\'][^>]*></div>',  # Empty app div (SPA)
-        r'window\.__NUXT__',  # Nuxt.js
-        r'__svelte',  # Svelte
+        ('__NEXT_DATA__', 'next_js'),
+        ('data-reactroot', 'react'),
+        ('data-react-helmet', 'react_helmet'),
+        ('ng-version', 'angular'),
+        ('v-cloak', 'vue'),
+        ('window.__NUXT__', 'nuxt'),
+        ('__svelte', 'svelte'),
     ]
+    # Empty app div (SPA), the one structural marker that needs a regex
+    JS_APP_DIV = r'<div[^>]*id=["\']app["\'][^>]*></div>'
     
     # Block/bot detection markers (Playwright → Provider)
     BLOCK_MARKERS = [
@@ -38,20 +78,99 @@ class EscalationSignal:
     ]
     
     # Status codes that indicate blocks
-    BLOCK_STATUS_CODES = [401, 403, 429]
+    BLOCK_STATUS_CODES = frozenset((401, 403, 429))
+    
+    # Framework markers and block interstitials sit in <head> or at the top
+    # of <body>, so healthy responses only have this much scanned
+    SCAN_PREFIX = 65536
+    # ...except these JS markers (indexes into JS_MARKERS), which Next.js
+    # and Nuxt emit at the end of <body>
+    _JS_TAIL_MARKERS = (0, 5)
+    
+    # (lowercase literal, regex to confirm or None, signal label): the
+    # needles as-is, then the app div, which only runs its regex once the
+    # page has a <div
+    _JS_MARKERS_RE = tuple(
+        (needle.lower().encode('ascii'), None, label)
+        for needle, label in JS_MARKERS
+    ) + (
+        (b'<div', re.compile(JS_APP_DIV.encode('ascii'), re.IGNORECASE), 'spa_app_div'),
+    )
+    # Tags that mark a page as already rendered server-side
+    _CONTENT_TAGS = (b'<h1', b'<table', b'<article', b'<main')
+    
+    # <meta name="robots" ...noindex...>, whatever else sits in the tag
+    _ROBOTS_NOINDEX_RE = re.compile(rb'<meta[^>]+name=["\']robots["\'][^>]+noindex')
+    
+    # Block markers are plain substrings, no regex needed
+    _BLOCK_LABELS = tuple(m.replace(' ', '_') for m in BLOCK_MARKERS)
     
     @classmethod
-    def detect_js_app(cls, html: str) -> List[str]:
+    def _scan_end(cls, html: str, status_code: Optional[int]) -> int:
+        """
+        How far into the page to scan: SCAN_PREFIX characters, or the whole
+        page when the status is missing or not 2xx.
+        """
+        if status_code is None or not 200 <= status_code < 300:
+            return len(html)
+        return min(cls.SCAN_PREFIX, len(html))
+    
+    @classmethod
+    def detect_js_app(cls, html: str, status_code: Optional[int] = None) -> List[str]:
         """Detect JavaScript framework markers in HTML."""
+        end = cls._scan_end(html, status_code)
+        return cls._detect_js_app(html, end, _ascii_lower(html[:end]))
+    
+    @classmethod
+    def _detect_js_app(cls, html: str, end: int, head: bytes, tail: bool = True) -> List[str]:
+        """
+        detect_js_app on an already lowered scan window (head = html[:end]).
+        With tail=False the end-of-body markers are only looked for in head.
+        """
+        if _JS_DB is not None:
+            # One caseless Hyperscan pass per buffer finds every marker
+            hits = _hyperscan_hits(_JS_DB, head)
+            if tail and end < len(html):
+                hits |= _hyperscan_hits(_JS_TAIL_DB, html.encode('latin-1', 'replace'))
+            return [label for i, (_, _, label) in enumerate(cls._JS_MARKERS_RE) if i in hits]
+        
         signals = []
-        html_lower = html.lower()
         
-        for pattern in cls.JS_MARKERS:
-            if re.search(pattern, html_lower, re.IGNORECASE):
-                signals.append(pattern.split(r'["\']')[0].replace('<', '').replace('script', 'script_tag'))
+        # latin-1 with "replace" keeps one byte per character, and
+        # bytes.lower() only folds ASCII, which is what the markers need;
+        # bytes `in` is CPython's fast substring search
+        full = head if end == len(html) else None
+        
+        for i, (literal, pattern, label) in enumerate(cls._JS_MARKERS_RE):
+            text = head
+            if tail and i in cls._JS_TAIL_MARKERS:
+                if full is None:
+                    full = _ascii_lower(html)
+                text = full
+            if literal in text and (pattern is None or pattern.search(text)):
+                signals.append(label)
         
         return signals
     
+    @classmethod
+    def _looks_like_complete_page(cls, html: str, head: bytes) -> bool:
+        """
+        Server-rendered page that arrived whole: closes </html>, and the
+        scan window has real content (<h1>, <table>, <article>, <main>)
+        after <body>.
+        """
+        if b'</html>' not in _ascii_lower(html[-1024:]):
+            return False
+        body = head.find(b'<body')
+        if body < 0:
+            return False
+        return any(head.find(tag, body) >= 0 for tag in cls._CONTENT_TAGS)
+    
+    @classmethod
+    def detect_robots_noindex(cls, head: bytes) -> bool:
+        """Meta robots noindex in a lowered scan window (see _ascii_lower)."""
+        return b'noindex' in head and cls._ROBOTS_NOINDEX_RE.search(head) is not None
+    
     @classmethod
     def detect_block(cls, html: str, status_code: int) -> List[str]:
         """Detect block/bot detection signals."""
@@ -62,10 +181,28 @@ class EscalationSignal:
             signals.append(f"status_{status_code}")
         
         # Check HTML content
-        html_lower = html.lower()
-        for pattern in cls.BLOCK_MARKERS:
-            if re.search(pattern, html_lower):
-                signals.append(pattern.replace(' ', '_'))
+        # Lowered rather than matched case-insensitively: the substring
+        # search below is far cheaper than an IGNORECASE regex, and on 2xx
+        # pages only the prefix gets copied
+        end = cls._scan_end(html, status_code)
+        if _BLOCK_DB is not None:
+            hits = _hyperscan_hits(_BLOCK_DB, html[:end].encode('latin-1', 'replace'))
+            signals.extend(cls._BLOCK_LABELS[i] for i in sorted(hits))
+            return signals
+        
+        html_lower = html[:end].lower()
+        if _BLOCK_AUTOMATON is not None:
+            # One Aho-Corasick pass finds every marker; report in list order
+            found = {i for _, i in _BLOCK_AUTOMATON.iter(html_lower)}
+            signals.extend(cls._BLOCK_LABELS[i] for i in sorted(found))
+        else:
+            # str `in` is CPython's C substring search (two-way with a bloom
+            # skip), so ten literal checks over the window stay out of the
+            # interpreter loop; a hand-written scan can't beat it from Python
+            signals.extend(
+                label for marker, label in zip(cls.BLOCK_MARKERS, cls._BLOCK_LABELS)
+                if marker in html_lower
+            )
         
         return signals
     
@@ -79,6 +216,55 @@ class EscalationSignal:
         return extracted_count == 0
 
 
+def _build_block_automaton():
+    if not HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for i, marker in enumerate(EscalationSignal.BLOCK_MARKERS):
+        automaton.add_word(marker, i)
+    automaton.make_automaton()
+    return automaton
+
+
+_BLOCK_AUTOMATON = _build_block_automaton()
+
+
+def _build_hyperscan_db(patterns: List[str], ids: List[int]):
+    """Caseless, report-once Hyperscan database; None without hyperscan."""
+    if not HAS_HYPERSCAN:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.encode('ascii') for p in patterns],
+        ids=ids,
+        elements=len(patterns),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+    )
+    return db
+
+
+def _hyperscan_hits(db, data: bytes) -> set:
+    """Ids of the patterns in db that match data."""
+    hits = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+    
+    db.scan(data, match_event_handler=on_match)
+    return hits
+
+
+_JS_DB = _build_hyperscan_db(
+    [re.escape(needle) for needle, _ in EscalationSignal.JS_MARKERS] + [EscalationSignal.JS_APP_DIV],
+    list(range(len(EscalationSignal._JS_MARKERS_RE)))
+)
+_JS_TAIL_DB = _build_hyperscan_db(
+    [re.escape(EscalationSignal.JS_MARKERS[i][0]) for i in EscalationSignal._JS_TAIL_MARKERS],
+    list(EscalationSignal._JS_TAIL_MARKERS)
+)
+_BLOCK_DB = _build_hyperscan_db(EscalationSignal.BLOCK_MARKERS, list(range(len(EscalationSignal.BLOCK_MARKERS))))
+
+
 class EscalationDecision:
     """Represents an escalation decision."""
     
@@ -100,7 +286,7 @@ class EscalationDecision:
             "to_engine": self.to_engine,
             "reason": self.reason,
             "signals": self.signals,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _utc_iso(time.time_ns())
         }
 
 
@@ -114,14 +300,16 @@ class AutoEscalationEngine:
     3. Provider (Zyte/ScrapingBee) - handles blocks
     """
     
-    TIER_ORDER = ["http", "playwright", "provider"]
+    TIER_ORDER = ("http", "playwright", "provider")
+    # Engine -> position in TIER_ORDER
+    TIER_INDEX = {engine: i for i, engine in enumerate(TIER_ORDER)}
     
     # Domains known to aggressively block non-browser traffic
     # Skip HTTP entirely, start with Playwright
-    HOSTILE_DOMAINS = {
+    HOSTILE_DOMAINS = frozenset({
         "www.fastpeoplesearch.com",
         "fastpeoplesearch.com",
-    }
+    })
     
     def __init__(self, engine_mode: str = "auto", domain: str = None):
         """
@@ -162,8 +350,16 @@ class AutoEscalationEngine:
                 signals=signals
             )
         
-        # Check for JS app markers
-        js_signals = EscalationSignal.detect_js_app(html)
+        # Lowered once for the JS markers and the robots check
+        end = EscalationSignal._scan_end(html, status_code)
+        head = _ascii_lower(html[:end])
+        
+        # Check for JS app markers. The common case is a complete 200 page
+        # with its content already in the HTML; a Next.js/Nuxt data blob at
+        # the end of such a page doesn't mean it needs a browser, so skip
+        # the full-page tail search there and only scan the window.
+        complete = status_code == 200 and EscalationSignal._looks_like_complete_page(html, head)
+        js_signals = EscalationSignal._detect_js_app(html, end, head, tail=not complete)
         if js_signals:
             signals.extend(js_signals)
             return EscalationDecision(
@@ -185,7 +381,7 @@ class AutoEscalationEngine:
                 )
         
         # Check for robots noindex (often JS-gated)
-        if '<meta name="robots" content="noindex"' in html.lower():
+        if EscalationSignal.detect_robots_noindex(head):
             signals.append("robots_noindex")
             return EscalationDecision(
                 from_engine="http",
@@ -262,11 +458,8 @@ class AutoEscalationEngine:
         if self.engine_mode != "auto":
             return False  # No escalation in forced mode
         
-        try:
-            current_idx = self.TIER_ORDER.index(current_engine)
-            return current_idx < len(self.TIER_ORDER) - 1
-        except ValueError:
-            return False
+        current_idx = self.TIER_INDEX.get(current_engine, -1)
+        return 0 <= current_idx < len(self.TIER_ORDER) - 1
     
     def log_attempt(
         self,
@@ -283,11 +476,15 @@ class AutoEscalationEngine:
             "signals": signals,
             "decision": decision,
             "success": success,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            # Formatted into "timestamp" by get_attempts_log
+            "ts_ns": time.time_ns()
         })
     
     def get_attempts_log(self) -> List[Dict[str, Any]]:
         """Get all logged attempts."""
+        for attempt in self.attempts:
+            if "ts_ns" in attempt:
+                attempt["timestamp"] = _utc_iso(attempt.pop("ts_ns"))
         return self.attempts
 
 
@@ -296,13 +493,15 @@ def generate_browser_profile(
     viewport_width: int = 1920,
     viewport_height: int = 1080,
     timezone: str = "America/New_York",
-    locale: str = "en-US"
+    locale: str = "en-US",
+    humanize: bool = False
 ) -> Dict[str, Any]:
     """
     Generate a stable browser fingerprint profile for Playwright.
     
     This provides consistent headers/settings to reduce false blocks.
     Not full stealth (no evasion plugins), just stable fingerprinting.
+    humanize turns on random pauses and mouse movement during extraction.
     """
     if user_agent is None:
         # Use a common, non-suspicious user agent
@@ -320,5 +519,6 @@ def generate_browser_profile(
         },
         "timezone": timezone,
         "locale": locale,
-        "accept_language": f"{locale},en;q=0.9"
+        "accept_language": f"{locale},en;q=0.9",
+        "humanize": humanize
     }
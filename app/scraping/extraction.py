@@ -1,8 +1,42 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 import re
-import json
+
+from json import loads as _stdlib_json_loads
+
+try:
+    from orjson import loads as _json_loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = _stdlib_json_loads
+    HAS_ORJSON = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+_JSONLD_CSS = 'script[type="application/ld+json"]'
+
+# Larger ld+json bodies are skipped rather than parsed
+MAX_JSONLD_CHARS = 2 * 1024 * 1024
+
+
+@lru_cache(maxsize=8)
+def get_selector(html: str):
+    """
+    Parse HTML into a parsel Selector, reusing recent parses.
+
+    One page is often read several times (fields, item links, pagination,
+    JSON-LD); keyed on the HTML string itself, so a hit is always the same
+    document. The tree is only read from, never modified.
+    """
+    from parsel import Selector
+    return Selector(text=html)
 
 
 def extract_jsonld_from_html(html: str, jsonld_type: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -16,47 +50,105 @@ def extract_jsonld_from_html(html: str, jsonld_type: Optional[str] = None) -> Li
     Returns:
         List of JSON-LD objects found
     """
-    from parsel import Selector
-    sel = Selector(text=html)
-    
+    if HAS_SELECTOLAX:
+        # Only the script bodies are needed; lexbor parses far faster than
+        # building the lxml tree
+        tree = LexborHTMLParser(html)
+        return extract_jsonld_from_scripts([node.text() for node in tree.css(_JSONLD_CSS)], jsonld_type)
+    return extract_jsonld_from_selector(get_selector(html), jsonld_type)
+
+
+def extract_jsonld_from_selector(sel, jsonld_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """extract_jsonld_from_html on an already parsed page."""
     # Find all JSON-LD script tags
-    jsonld_scripts = sel.css('script[type="application/ld+json"]::text').getall()
-    
+    return extract_jsonld_from_scripts(sel.css(f'{_JSONLD_CSS}::text').getall(), jsonld_type)
+
+
+def extract_jsonld_from_scripts(jsonld_scripts: List[str], jsonld_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """JSON-LD objects from ld+json script bodies (e.g. collected in a browser)."""
     results = []
     for script_content in jsonld_scripts:
-        try:
-            data = json.loads(script_content)
-            
-            # Handle @graph wrapper
-            if isinstance(data, dict) and "@graph" in data:
-                items = data["@graph"]
-            elif isinstance(data, list):
-                items = data
-            else:
-                items = [data]
-            
-            # Filter by type if specified
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                    
-                if jsonld_type:
-                    item_type = item.get("@type", "")
-                    if item_type == jsonld_type:
-                        results.append(item)
-                else:
-                    results.append(item)
-                    
-        except json.JSONDecodeError:
+        if len(script_content) > MAX_JSONLD_CHARS:
             continue
+        # Cheap reject before parsing: the wanted @type has to appear
+        if jsonld_type and f'"{jsonld_type}"' not in script_content:
+            continue
+        
+        data = _parse_jsonld(script_content)
+        if data is None:
+            continue
+        # The parse is cached; hand callers their own copy to mutate
+        data = _copy_json(data)
+        
+        # Handle @graph wrapper
+        if isinstance(data, dict) and "@graph" in data:
+            items = data["@graph"]
+        elif isinstance(data, list):
+            items = data
+        else:
+            items = [data]
+        
+        # Filter by type if specified
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+                
+            if jsonld_type:
+                item_type = item.get("@type", "")
+                if item_type == jsonld_type:
+                    results.append(item)
+            else:
+                results.append(item)
     
     return results
 
 
+@lru_cache(maxsize=64)
+def _parse_jsonld(script_content: str) -> Any:
+    """
+    Parse one ld+json body, None if it isn't valid JSON.
+
+    Cached because escalation re-reads the same page; the parsed objects are
+    shared between calls, so only ever return them through _copy_json.
+    """
+    # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+    try:
+        return _json_loads(script_content)
+    except ValueError:
+        if not HAS_ORJSON:
+            return None
+    # orjson is stricter than json (it rejects NaN/Infinity, for one);
+    # give those bodies the stdlib parse they always had
+    try:
+        return _stdlib_json_loads(script_content)
+    except ValueError:
+        return None
+
+
+def _copy_json(value: Any) -> Any:
+    """Deep copy of parsed JSON (dicts, lists and immutable scalars only)."""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(regex: str) -> re.Pattern:
+    """Compile a spec regex once; re's own cache is small and shared process-wide."""
+    return re.compile(regex)
+
+
 def _apply_regex(value: Any, regex: Optional[str]) -> Any:
     if not regex or value is None:
         return value
-    pattern = re.compile(regex)
+    return _apply_pattern(value, _compile_regex(regex))
+
+
+def _apply_pattern(value: Any, pattern: Optional[re.Pattern]) -> Any:
+    if pattern is None or value is None:
+        return value
 
     if isinstance(value, list):
         out: List[Any] = []
@@ -76,12 +168,228 @@ def _apply_regex(value: Any, regex: Optional[str]) -> Any:
         return None
 
 
+@lru_cache(maxsize=2048)
+def css_to_xpath(css: str) -> str:
+    """XPath 1.0 translation of a CSS selector (cssselect, so :contains() works)."""
+    from parsel.csstranslator import HTMLTranslator
+    return HTMLTranslator().css_to_xpath(css)
+
+
+@lru_cache(maxsize=2048)
+def compile_css(css: str):
+    """
+    Translate a CSS selector to XPath and compile it once.
+    
+    Parsel re-compiles the XPath on every sel.css() call; site configs reuse
+    the same handful of selectors across every page, so cache the compiled
+    lxml XPath per selector string. The translation goes through
+    compile_xpath, so CSS strings that translate to the same XPath (and
+    hand-written XPaths equal to a translation) share one compiled object.
+    """
+    return compile_xpath(css_to_xpath(css))
+
+
+@lru_cache(maxsize=2048)
+def compile_xpath(xpath: str):
+    """Compile a hand-written XPath selector once."""
+    from lxml import etree
+    return etree.XPath(xpath, smart_strings=False)
+
+
+@lru_cache(maxsize=1)
+def _normalize_space():
+    from lxml import etree
+    return etree.XPath("normalize-space()", smart_strings=False)
+
+
+def _extract_compiled(root, compiled, attr: Optional[str], want_all: bool) -> Any:
+    """Same semantics as the parsel path below, on a precompiled selector."""
+    return _values_from_nodes(compiled(root), attr, want_all)
+
+
+def _values_from_nodes(nodes, attr: Optional[str], want_all: bool) -> Any:
+    if attr:
+        if want_all:
+            return [v for v in (n.get(attr) for n in nodes) if v]
+        return nodes[0].get(attr) if nodes else None
+
+    normalize = _normalize_space()
+    if want_all:
+        return [x.strip() for x in (normalize(n) for n in nodes) if x and x.strip()]
+    return normalize(nodes[0]) if nodes else None
+
+
+@dataclass(slots=True, frozen=True)
+class FieldsPlan:
+    """
+    A field map flattened into parallel tuples (one slot per field).
+
+    Fields that share a selector share one entry in `selectors`, and
+    slots[i] is field i's index into it, so each distinct selector walks
+    the tree once per page. slots[i] is None when the field needs parsel
+    (::text/::attr() pseudo-elements, or a selector that doesn't compile);
+    extract_fields falls back to extract_from_selector(sel, specs[i]).
+    """
+    names: Tuple[str, ...]
+    selectors: Tuple[Any, ...]
+    slots: Tuple[Optional[int], ...]
+    attrs: Tuple[Optional[str], ...]
+    all_flags: Tuple[bool, ...]
+    patterns: Tuple[Optional[re.Pattern], ...]
+    specs: Tuple[Dict[str, Any], ...]
+
+
+def _compile_spec(spec: Dict[str, Any]):
+    xpath = spec.get("xpath")
+    css = spec.get("css", "")
+    try:
+        if xpath:
+            return compile_xpath(xpath)
+        if css and "::" not in css:
+            return compile_css(css)
+    except Exception:
+        # Leave invalid selectors to the parsel path, which raises per page
+        # exactly as before
+        pass
+    return None
+
+
+def compile_fields_plan(field_map: Mapping[str, Dict[str, Any]]) -> FieldsPlan:
+    """Flatten {field_name: selector_spec} into a FieldsPlan, compiling selectors once."""
+    names = tuple(field_map)
+    specs = tuple(field_map[name] for name in names)
+
+    selectors: List[Any] = []
+    slots: List[Optional[int]] = []
+    for spec in specs:
+        compiled = _compile_spec(spec)
+        if compiled is None:
+            slots.append(None)
+            continue
+        # compile_css/compile_xpath are cached, so equal selectors come back
+        # as the same object
+        for i, existing in enumerate(selectors):
+            if existing is compiled:
+                slots.append(i)
+                break
+        else:
+            slots.append(len(selectors))
+            selectors.append(compiled)
+
+    return FieldsPlan(
+        names=names,
+        selectors=tuple(selectors),
+        slots=tuple(slots),
+        attrs=tuple(spec.get("attr") for spec in specs),
+        all_flags=tuple(bool(spec.get("all", False)) for spec in specs),
+        patterns=tuple(_compile_regex(spec["regex"]) if spec.get("regex") else None for spec in specs),
+        specs=specs
+    )
+
+
+def extract_fields(sel, plan: FieldsPlan | Mapping[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Extract every field of a plan from one parsed page.
+
+    A plain {field_name: selector_spec} map is accepted too and compiled on
+    the spot (selectors come from the compile caches); callers extracting
+    many pages should compile the plan once instead.
+    """
+    if not isinstance(plan, FieldsPlan):
+        plan = compile_fields_plan(plan)
+    names, slots, attrs, all_flags, patterns = (
+        plan.names, plan.slots, plan.attrs, plan.all_flags, plan.patterns
+    )
+    if getattr(sel, "type", None) == "html":
+        root = sel.root
+        node_sets = [selector(root) for selector in plan.selectors]
+    else:
+        node_sets = None
+
+    out: Dict[str, Any] = {}
+    for i in range(len(names)):
+        if node_sets is not None and slots[i] is not None:
+            out[names[i]] = _apply_pattern(_values_from_nodes(node_sets[slots[i]], attrs[i], all_flags[i]), patterns[i])
+        else:
+            out[names[i]] = extract_from_selector(sel, plan.specs[i])
+    return out
+
+
+def compile_fields_extractor(plan: FieldsPlan) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a straight-line extract(sel) -> dict for a plan.
+
+    Same results as extract_fields(sel, plan), but each field's attr/all/
+    regex handling is decided here once and emitted as its own statement,
+    with selectors and patterns bound as globals of the generated code.
+    """
+    namespace: Dict[str, Any] = {
+        "_plan": plan,
+        "_extract_fields": extract_fields,
+        "_extract_from_selector": extract_from_selector,
+        "_apply_pattern": _apply_pattern,
+        "_normalize": _normalize_space(),
+    }
+    lines = [
+        "def extract(sel):",
+        "    if getattr(sel, 'type', None) != 'html':",
+        "        return _extract_fields(sel, _plan)",
+        "    root = sel.root",
+        "    out = {}",
+    ]
+    for j, selector in enumerate(plan.selectors):
+        namespace[f"_sel{j}"] = selector
+        lines.append(f"    n{j} = _sel{j}(root)")
+
+    for i, name in enumerate(plan.names):
+        slot = plan.slots[i]
+        if slot is None:
+            namespace[f"_spec{i}"] = plan.specs[i]
+            lines.append(f"    out[{name!r}] = _extract_from_selector(sel, _spec{i})")
+            continue
+
+        nodes = f"n{slot}"
+
+        attr, want_all = plan.attrs[i], plan.all_flags[i]
+        if attr and want_all:
+            value = f"[v for v in (n.get({attr!r}) for n in {nodes}) if v]"
+        elif attr:
+            value = f"{nodes}[0].get({attr!r}) if {nodes} else None"
+        elif want_all:
+            value = f"[x.strip() for x in (_normalize(n) for n in {nodes}) if x and x.strip()]"
+        else:
+            value = f"_normalize({nodes}[0]) if {nodes} else None"
+
+        if plan.patterns[i] is not None:
+            namespace[f"_pat{i}"] = plan.patterns[i]
+            value = f"_apply_pattern({value}, _pat{i})"
+        lines.append(f"    out[{name!r}] = {value}")
+
+    lines.append("    return out")
+    exec(compile("\n".join(lines) + "\n", "<fields extractor>", "exec"), namespace)
+    return namespace["extract"]
+
+
+def extract_all(
+    html: str,
+    field_map: FieldsPlan | Mapping[str, Dict[str, Any]],
+    jsonld_type: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Extract the fields and the JSON-LD objects of one page from a single parse.
+    
+    Returns:
+        ({field_name: value}, JSON-LD objects filtered by jsonld_type)
+    """
+    sel = get_selector(html)
+    return extract_fields(sel, field_map), extract_jsonld_from_selector(sel, jsonld_type)
+
+
 def extract_from_html_css(html: str, spec: Dict[str, Any]) -> Any:
     """
     Pure HTML extraction (used for selector validation and browser content if needed)
     """
-    from parsel import Selector
-    sel = Selector(text=html)
+    sel = get_selector(html)
     return extract_from_selector(sel, spec)
 
 
@@ -90,27 +398,39 @@ def extract_from_selector(sel, spec: Dict[str, Any]) -> Any:
     Scrapy/Parsel-based extraction. Works for HTTP-fetched pages.
     """
     css = spec.get("css", "")
-    if not css:
+    # Optional hand-written XPath, preferred over css when present
+    xpath = spec.get("xpath")
+    if not css and not xpath:
         return None
 
     attr = spec.get("attr")
     want_all = bool(spec.get("all", False))
     regex = spec.get("regex")
 
+    # Fast path: element selectors on an HTML document use the compiled cache
+    # (pseudo-elements like ::text/::attr() go through parsel)
+    if getattr(sel, "type", None) == "html":
+        if xpath:
+            return _apply_regex(_extract_compiled(sel.root, compile_xpath(xpath), attr, want_all), regex)
+        if "::" not in css:
+            return _apply_regex(_extract_compiled(sel.root, compile_css(css), attr, want_all), regex)
+
+    nodes = sel.xpath(xpath) if xpath else sel.css(css)
+
     if attr:
         if want_all:
-            vals = [n.attrib.get(attr) for n in sel.css(css)]
+            vals = [n.attrib.get(attr) for n in nodes]
             out = [v for v in vals if v]
         else:
-            n = sel.css(css).get()
+            n = nodes.get()
             if not n:
                 out = None
             else:
-                out = sel.css(css).attrib.get(attr)
+                out = nodes.attrib.get(attr)
     else:
         if want_all:
-            out = [x.strip() for x in sel.css(css).xpath("normalize-space()").getall() if x and x.strip()]
+            out = [x.strip() for x in nodes.xpath("normalize-space()").getall() if x and x.strip()]
         else:
-            out = sel.css(css).xpath("normalize-space()").get()
+            out = nodes.xpath("normalize-space()").get()
 
     return _apply_regex(out, regex)
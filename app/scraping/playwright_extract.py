@@ -3,25 +3,264 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 from playwright.sync_api import sync_playwright
 from urllib.parse import urlparse
+import atexit
+import hashlib
+import json
 import logging
+import random
+import re
+import threading
+import time
 
 from app.config import settings
-from app.scraping.session_manager import get_session_manager
+from app.scraping.extraction import (
+    FieldsPlan,
+    _apply_pattern,
+    compile_fields_plan,
+    css_to_xpath,
+    extract_jsonld_from_scripts,
+)
+from app.scraping.session_manager import SessionLifecycleManager, get_session_manager
 
 logger = logging.getLogger(__name__)
 
+# One Chromium per worker thread, launched on first use. Each extraction
+# gets its own context (cheap) instead of a fresh browser (slow cold start).
+# The sync API is bound to the thread that started it and is not
+# thread-safe, so every thread keeps its own Playwright + browser (Celery's
+# prefork pool means one per process in practice).
+_LOCAL = threading.local()
+# Every thread's {"pw", "browser", "contexts"}, for shutdown
+_INSTANCES: List[Dict[str, Any]] = []
+_INSTANCES_LOCK = threading.Lock()
 
-def _extract_jsonld_if_present(html: str, url: str) -> Optional[List[Dict[str, Any]]]:
+
+# DataDome-aware configuration (NOT Cloudflare)
+_LAUNCH_OPTIONS: Dict[str, Any] = dict(
+    headless=True,
+    args=[
+        "--disable-blink-features=AutomationControlled",
+        "--disable-dev-shm-usage",
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        # DataDome fingerprinting mitigation
+        "--disable-features=IsolateOrigins,site-per-process",
+        "--disable-site-isolation-trials",
+        # Additional container stability flags
+        "--disable-gpu",
+        "--single-process",
+        "--no-zygote",
+        # Never fetch/decode images, and don't throttle or phone home
+        "--blink-settings=imagesEnabled=false",
+        "--disable-background-networking",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+    ],
+    timeout=60000  # 60 second browser launch timeout
+)
+
+
+def _get_browser():
+    """Return this thread's browser, (re)launching it if needed."""
+    state = getattr(_LOCAL, "state", None)
+    if state is None:
+        state = _LOCAL.state = {"pw": sync_playwright().start(), "browser": None, "contexts": {}}
+        with _INSTANCES_LOCK:
+            if not _INSTANCES:
+                atexit.register(_close_browsers)
+            _INSTANCES.append(state)
+
+    browser = state["browser"]
+    if browser is None or not browser.is_connected():
+        browser = state["browser"] = state["pw"].chromium.launch(**_LAUNCH_OPTIONS)
+        # Contexts of a dead browser are gone with it
+        state["contexts"] = {}
+    return browser
+
+
+def _close_browsers() -> None:
+    with _INSTANCES_LOCK:
+        for state in _INSTANCES:
+            try:
+                if state["browser"] is not None:
+                    state["browser"].close()
+                state["pw"].stop()
+            except Exception as e:
+                # Another thread's instance can't be driven from here; its
+                # driver process exits with ours
+                logger.debug(f"Browser shutdown failed: {e}")
+        _INSTANCES.clear()
+
+
+# Stylesheets stay: modal detection and clicks depend on real layout/visibility
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Fingerprint patches run before any page script (DataDome-aware).
+# Built once at import; every context registers the same string.
+_STEALTH_JS = """
+// Add chrome object
+window.chrome = {
+    runtime: {},
+    loadTimes: function() {},
+    csi: function() {},
+    app: {}
+};
+
+// Fix permissions
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: 'prompt' }) :
+        originalQuery(parameters)
+);
+
+Object.defineProperties(navigator, {
+    // Remove webdriver property
+    webdriver: { get: () => undefined },
+    // Plugin array with realistic plugins
+    plugins: {
+        get: () => [
+            {name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer'},
+            {name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai'},
+            {name: 'Native Client', filename: 'internal-nacl-plugin'}
+        ]
+    },
+    languages: { get: () => ['en-US', 'en'] },
+    hardwareConcurrency: { get: () => 8 },
+    deviceMemory: { get: () => 8 },
+    connection: {
+        get: () => ({
+            effectiveType: '4g',
+            rtt: 100,
+            downlink: 10,
+            saveData: false
+        })
+    }
+});
+"""
+
+# Consent/agreement modals to click through (ThatsThem, ZabaSearch FCRA agreements)
+_AGREE_SELECTORS = (
+    "#checkbox",  # ZabaSearch checkbox
+    "div.verify",  # ZabaSearch verify button
+    "button:has-text('I Agree')",
+    "button:has-text('I AGREE')",
+    "button:has-text('Accept')",
+    "input[type='checkbox'][id*='agree']",
+    "input[type='checkbox'][id*='consent']",
+)
+# One locator for all of them (first visible match), so a page without a
+# modal costs a single short wait instead of one per selector
+_AGREE_SELECTOR = ", ".join(_AGREE_SELECTORS) + " >> visible=true"
+
+
+def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _wait_for_jsonld(page, timeout_ms: int = 1000) -> bool:
+    """
+    True once a JSON-LD script is attached to the DOM, False on timeout.
+
+    Server-rendered JSON-LD is already there at domcontentloaded, so the
+    timeout only covers script-injected blobs; pages without JSON-LD pay it
+    in full, hence short.
+    """
+    try:
+        page.wait_for_selector("script[type='application/ld+json']", state="attached", timeout=timeout_ms)
+        return True
+    except Exception:
+        return False
+
+
+def _wait_for_fields(page, plan: FieldsPlan, timeout_ms: int = 5000) -> None:
+    """
+    Give client-rendered content a chance to appear: wait for the first
+    field's selector (not for the whole network to go quiet).
+    """
+    for spec in plan.specs:
+        xpath = spec.get("xpath")
+        selector = f"xpath={xpath}" if xpath else spec.get("css")
+        if selector:
+            try:
+                page.wait_for_selector(selector, state="attached", timeout=timeout_ms)
+            except Exception:
+                pass  # Extraction reports whatever is there
+            return
+
+
+def _simulate_visitor(page, humanize: bool = False) -> None:
+    """
+    Scroll a little, then click through agreement modals.
+
+    With humanize (browser_profile["humanize"]) the mouse moves and the
+    steps are paced with random pauses; otherwise nothing sleeps.
+    """
+    # Simulate human-like behavior: random small mouse movements and scrolling
+    try:
+        if humanize:
+            # Move mouse to random positions (simulates human looking at content)
+            page.mouse.move(random.randint(100, 400), random.randint(100, 300))
+            time.sleep(random.uniform(0.1, 0.3))
+        
+        # Small scroll down (humans often scroll a bit)
+        page.evaluate("window.scrollBy(0, 100)")
+        if humanize:
+            time.sleep(random.uniform(0.2, 0.5))
+    except Exception:
+        pass  # Not critical if this fails
+
+    # Handle common modal checkboxes
+    try:
+        if humanize:
+            # Wait a bit for modals to appear
+            time.sleep(random.uniform(0.5, 1.0))
+        
+        # Try to click "I Agree" style buttons/checkboxes
+        element = page.locator(_AGREE_SELECTOR).first
+        try:
+            element.wait_for(state="visible", timeout=500)
+        except Exception:
+            return  # No modal on this page
+
+        logger.info("✅ Found agreement element, clicking...")
+        if humanize:
+            # Move mouse to element first (more human-like)
+            box = element.bounding_box()
+            if box:
+                page.mouse.move(
+                    box['x'] + box['width'] / 2,
+                    box['y'] + box['height'] / 2
+                )
+                time.sleep(random.uniform(0.1, 0.3))
+        element.click(timeout=2000)
+        if humanize:
+            time.sleep(random.uniform(0.5, 1.0))  # Human-like delay after click
+        # Wait for page to update after modal dismissal
+        page.wait_for_load_state("domcontentloaded", timeout=2000)
+    except Exception as e:
+        logger.debug(f"No modal found or already dismissed: {e}")
+
+
+# Bodies of the page's ld+json scripts, read in the browser so the whole
+# DOM doesn't have to be serialized and re-parsed just to find them
+_JSONLD_BLOBS_JS = """
+() => Array.from(document.querySelectorAll('script[type="application/ld+json"]')).map(s => s.textContent)
+"""
+
+
+def _extract_jsonld_from_blobs(blobs: List[str], url: str) -> Optional[List[Dict[str, Any]]]:
     """
-    Check if page contains JSON-LD structured data and extract it.
+    Check the page's JSON-LD script bodies for structured data and extract it.
     Returns None if no usable JSON-LD found.
     
     For FastPeopleSearch, extracts Person objects with phones, addresses, etc.
     """
-    from app.scraping.extraction import extract_jsonld_from_html
-    
     # Check for JSON-LD Person objects (people search sites)
-    person_objects = extract_jsonld_from_html(html, jsonld_type="Person")
+    person_objects = extract_jsonld_from_scripts(blobs, jsonld_type="Person")
     
     if not person_objects:
         return None
@@ -70,7 +309,11 @@ def _extract_jsonld_if_present(html: str, url: str) -> Optional[List[Dict[str, A
         relatives = person.get("relatedTo", [])
         if relatives:
             if isinstance(relatives, list):
-                record["relatives"] = [r.get("name") for r in relatives if isinstance(r, dict) and "name" in r]
+                # JSON-LD objects decode to plain dicts; one lookup per entry
+                record["relatives"] = [
+                    name for r in relatives
+                    if type(r) is dict and (name := r.get("name")) is not None
+                ]
             elif isinstance(relatives, dict):
                 record["relatives"] = [relatives.get("name")]
         
@@ -80,9 +323,266 @@ def _extract_jsonld_if_present(html: str, url: str) -> Optional[List[Dict[str, A
     return records
 
 
+# Runs every field's selector in the page and returns {name: value}.
+# Mirrors the per-locator loop it replaced: innerText (or the attribute),
+# trimmed; "all" keeps the non-empty values, otherwise the first match.
+# A selector the browser rejects nulls its own field, not the record.
+# Only standard CSS/XPath runs here; see _PLAYWRIGHT_ONLY_SELECTOR.
+_EXTRACT_FIELDS_JS = """
+(fields) => {
+    const out = {};
+    for (const [name, selector, isXpath, attr, all] of fields) {
+        let els;
+        try {
+            if (isXpath) {
+                const snap = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                els = [];
+                for (let i = 0; i < snap.snapshotLength; i++) els.push(snap.snapshotItem(i));
+            } else {
+                els = Array.from(document.querySelectorAll(selector));
+            }
+        } catch (e) {
+            out[name] = null;
+            continue;
+        }
+        const value = (e) => {
+            const v = attr ? (e.getAttribute ? e.getAttribute(attr) : null) : (e.innerText ?? e.textContent);
+            return v == null ? null : v.trim();
+        };
+        if (all) {
+            out[name] = els.map(value).filter(Boolean);
+        } else {
+            out[name] = els.length ? (value(els[0]) || null) : null;
+        }
+    }
+    return out;
+}
+"""
+
+# Selector syntax only Playwright's engine understands (text/layout
+# pseudo-classes, ">>" chaining, "engine=" prefixes). querySelectorAll
+# rejects these, so such fields keep the per-locator path.
+_PLAYWRIGHT_ONLY_SELECTOR = re.compile(
+    r">>|:(?:has-text|text|text-is|text-matches|nth-match|visible|left-of|right-of|above|below|near)\b"
+    r"|^\s*(?:text|css|xpath|id|data-testid|internal:[\w-]+)="
+)
+
+# Defined once per context as a non-enumerable global (init script), so
+# each page compiles the extractor once and extraction sends only a thunk
+_EXTRACT_FIELDS_GLOBAL = "__sgExtractFields"
+_EXTRACT_FIELDS_INIT_JS = (
+    f"Object.defineProperty(window, '{_EXTRACT_FIELDS_GLOBAL}', "
+    f"{{value: {_EXTRACT_FIELDS_JS.strip()}, enumerable: false}});"
+)
+_EXTRACT_FIELDS_CALL_JS = f"(fields) => window.{_EXTRACT_FIELDS_GLOBAL}(fields)"
+
+
+def _context_options(browser_profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """new_context() options for a browser profile (DataDome-aware)."""
+    context_options = {}
+    
+    if browser_profile:
+        context_options["user_agent"] = browser_profile.get("user_agent", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        if "viewport" in browser_profile:
+            context_options["viewport"] = browser_profile["viewport"]
+        if "timezone_id" in browser_profile:
+            context_options["timezone_id"] = browser_profile["timezone_id"]
+        if "locale" in browser_profile:
+            context_options["locale"] = browser_profile["locale"]
+        if "permissions" in browser_profile:
+            context_options["permissions"] = browser_profile["permissions"]
+        if "color_scheme" in browser_profile:
+            context_options["color_scheme"] = browser_profile["color_scheme"]
+        if "reduced_motion" in browser_profile:
+            context_options["reduced_motion"] = browser_profile["reduced_motion"]
+        if "forced_colors" in browser_profile:
+            context_options["forced_colors"] = browser_profile["forced_colors"]
+    else:
+        context_options["user_agent"] = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    return context_options
+
+
+def _field_records(plan: FieldsPlan) -> tuple[List[list], List[int]]:
+    """
+    _EXTRACT_FIELDS_JS's argument, [name, selector, isXpath, attr, all] per
+    field, and the indices of fields whose CSS needs Playwright's engine.
+    """
+    fields = []
+    locator_fields = []
+    for i, spec in enumerate(plan.specs):
+        css = spec.get("css", "")
+        xpath = spec.get("xpath")
+        if not css and not xpath:
+            continue
+        if not xpath and _PLAYWRIGHT_ONLY_SELECTOR.search(css):
+            locator_fields.append(i)
+            continue
+        if not xpath and ":contains(" in css:
+            # querySelectorAll has no :contains(); run cssselect's XPath
+            # translation instead (an invalid selector is left for the
+            # browser to reject, nulling just this field)
+            try:
+                xpath = css_to_xpath(css)
+            except Exception:
+                pass
+        # Prefer the static XPath
+        fields.append([plan.names[i], xpath or css, bool(xpath), plan.attrs[i], plan.all_flags[i]])
+    return fields, locator_fields
+
+
+def _extract_with_locator(page, selector: str, attr: Optional[str], want_all: bool) -> Any:
+    """One field through page.locator(), for Playwright-only selector syntax."""
+    try:
+        loc = page.locator(selector)
+        # count() first: inner_text() on a missing element waits out the timeout
+        count = loc.count()
+        vals: List[Any] = []
+        for i in range(count if want_all else min(count, 1)):
+            el = loc.nth(i)
+            v = el.get_attribute(attr) if attr else el.inner_text()
+            if v is not None:
+                v = v.strip()
+            if v:
+                vals.append(v)
+    except Exception as e:
+        logger.debug(f"Locator extraction failed for {selector!r}: {e}")
+        return None
+    if want_all:
+        return vals
+    return vals[0] if vals else None
+
+
+def _apply_field_values(plan: FieldsPlan, values: Dict[str, Any]) -> Dict[str, Any]:
+    """{field_name: value} from the in-page values, with each field's regex applied."""
+    record: Dict[str, Any] = dict.fromkeys(plan.names)
+    for i, field_name in enumerate(plan.names):
+        if field_name in values:
+            record[field_name] = _apply_pattern(values[field_name], plan.patterns[i])
+    return record
+
+
+def _extract_fields_in_page(page, plan: FieldsPlan) -> Dict[str, Any]:
+    """
+    Extract every field of a plan with a single page.evaluate(), plus a
+    locator round-trip per field using Playwright-only selector syntax.
+    """
+    fields, locator_fields = _field_records(plan)
+    values = page.evaluate(_EXTRACT_FIELDS_CALL_JS, fields) if fields else {}
+    for i in locator_fields:
+        values[plan.names[i]] = _extract_with_locator(
+            page, plan.specs[i]["css"], plan.attrs[i], plan.all_flags[i]
+        )
+    return _apply_field_values(plan, values)
+
+
+# Contexts are pooled per thread by (site, proxy, context options, session
+# fingerprint): a repeat visit gets a new page in a warm context, skipping
+# context setup (init scripts, routing, cookie/storage restore). Keying on
+# the session means newly supplied vault/intervention cookies always get a
+# context built from them rather than a warm one from before the login.
+# A context is dropped after a failed extraction or _CONTEXT_MAX_USES pages
+# (rotating its cookies), and the least recently used goes past
+# _CONTEXT_POOL_SIZE.
+_CONTEXT_POOL_SIZE = 8
+_CONTEXT_MAX_USES = 50
+
+
+def _session_fingerprint(session_data: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Digest of the cookies/storage_state a context would be built from."""
+    if not session_data:
+        return None
+    storage_state = session_data.get("storage_state")
+    state = {"storage_state": storage_state} if storage_state else {"cookies": session_data.get("cookies", [])}
+    return hashlib.sha1(json.dumps(state, sort_keys=True).encode()).hexdigest()
+
+
+def _acquire_context(browser, key: tuple, context_options: Dict[str, Any],
+                     session_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """This thread's pooled {"ctx", "uses"} for key, or a new one."""
+    entry = _LOCAL.state["contexts"].pop(key, None)
+    if entry is not None:
+        return entry
+
+    # Apply session data if provided
+    cookies = None
+    if session_data:
+        storage_state = session_data.get("storage_state")
+        if storage_state:
+            context_options = {**context_options, "storage_state": storage_state}
+        else:
+            cookies = session_data.get("cookies", [])
+    ctx = browser.new_context(**context_options)
+    try:
+        if cookies:
+            ctx.add_cookies(cookies)
+        ctx.add_init_script(_STEALTH_JS)
+        ctx.add_init_script(_EXTRACT_FIELDS_INIT_JS)
+        
+        # Images, media and fonts never feed extraction; skipping them lets
+        # the page settle sooner. Stylesheets stay: innerText depends on them.
+        ctx.route("**/*", _block_heavy_resources)
+    except Exception:
+        ctx.close()
+        raise
+    return {"ctx": ctx, "uses": 0}
+
+
+def _release_context(key: tuple, entry: Dict[str, Any], healthy: bool) -> None:
+    """Return a context to the pool, or close it if it failed or is worn out."""
+    entry["uses"] += 1
+    if not healthy or entry["uses"] >= _CONTEXT_MAX_USES:
+        _close_context(entry)
+        return
+
+    pool = _LOCAL.state["contexts"]
+    pool[key] = entry  # (Re)inserted last: most recently used
+    while len(pool) > _CONTEXT_POOL_SIZE:
+        _close_context(pool.pop(next(iter(pool))))
+
+
+def _close_context(entry: Dict[str, Any]) -> None:
+    try:
+        entry["ctx"].close()
+    except Exception as e:
+        logger.debug(f"Context close failed: {e}")
+
+
+# Whether the page wrote localStorage, the only part of storage_state()
+# beyond cookies that a new context restores
+_HAS_LOCAL_STORAGE_JS = "() => { try { return localStorage.length > 0; } catch (e) { return false; } }"
+
+
+def _capture_session(ctx, page, session_mgr: SessionLifecycleManager, site_domain: str,
+                     context_options: Dict[str, Any], note: str) -> None:
+    """
+    Store a new session's cookies (and storage_state, if the page wrote
+    localStorage) for reuse. A page that set neither leaves nothing to reuse.
+    """
+    try:
+        captured_cookies = ctx.cookies()
+        # storage_state() serializes the whole context; only pay for it when
+        # it carries more than the cookies we already have
+        has_local_storage = page.evaluate(_HAS_LOCAL_STORAGE_JS)
+        if not captured_cookies and not has_local_storage:
+            return
+        
+        # Store session for future reuse
+        session_mgr.create_session(
+            site_domain=site_domain,
+            cookies=captured_cookies,
+            storage_state=ctx.storage_state() if has_local_storage else None,
+            proxy_identity=None,  # Will be passed when proxy support added
+            user_agent=context_options.get("user_agent"),
+            viewport=context_options.get("viewport")
+        )
+        logger.info(f"💾 Captured session state for {site_domain} ({note})")
+    except Exception as e:
+        logger.warning(f"Failed to capture session state: {e}")
+
+
 def extract_with_playwright(
     url: str,
-    field_map: Dict[str, Dict[str, Any]],
+    field_map: FieldsPlan | Dict[str, Dict[str, Any]],
     session_data: Optional[Dict[str, Any]] = None,
     browser_profile: Optional[Dict[str, Any]] = None,
     proxy_identity: Optional[str] = None
@@ -99,11 +599,13 @@ def extract_with_playwright(
     
     Args:
         url: Target URL to scrape
-        field_map: Field selector specifications
+        field_map: Field selector specifications, or a FieldsPlan compiled from them
         session_data: Optional session cookies/storage for authenticated scraping (legacy)
         browser_profile: Optional browser fingerprint profile for stable headers
         proxy_identity: Optional proxy identifier for session keying
     """
+    plan = field_map if isinstance(field_map, FieldsPlan) else compile_fields_plan(field_map)
+
     # Extract site domain for session management
     parsed = urlparse(url)
     site_domain = parsed.netloc
@@ -127,8 +629,9 @@ def extract_with_playwright(
     
     try:
         result = _extract_with_playwright_internal(
-            url, field_map, session_data, browser_profile, 
-            site_domain, existing_session is not None
+            url, plan, session_data, browser_profile, 
+            site_domain, existing_session is not None, session_mgr,
+            proxy_identity
         )
         extraction_successful = True
         return result
@@ -150,285 +653,91 @@ def extract_with_playwright(
 
 def _extract_with_playwright_internal(
     url: str,
-    field_map: Dict[str, Dict[str, Any]],
+    plan: FieldsPlan,
     session_data: Optional[Dict[str, Any]],
     browser_profile: Optional[Dict[str, Any]],
     site_domain: str,
-    is_reused_session: bool
+    is_reused_session: bool,
+    session_mgr: SessionLifecycleManager,
+    proxy_identity: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Internal Playwright extraction with session capture.
     
     Separated from extract_with_playwright to properly handle session lifecycle
-    in finally block.
+    in finally block. session_mgr is the caller's manager, looked up once
+    per request. Runs in a new page of a pooled context (see _acquire_context).
     """
-    session_mgr = get_session_manager()
+    browser = _get_browser()
+    # Human pacing (random sleeps, mouse moves) is opt-in per profile;
+    # JSON-LD sites don't need it
+    humanize = bool(browser_profile and browser_profile.get("humanize"))
+
+    context_options = _context_options(browser_profile)
+    pool_key = (
+        site_domain,
+        proxy_identity,
+        json.dumps(context_options, sort_keys=True),
+        _session_fingerprint(session_data),
+    )
+    entry = _acquire_context(browser, pool_key, context_options, session_data)
+    ctx = entry["ctx"]
+    page = None
+    healthy = False
     
-    with sync_playwright() as p:
-        # DataDome-aware configuration (NOT Cloudflare)
-        browser = p.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                # DataDome fingerprinting mitigation
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-site-isolation-trials",
-                # Additional container stability flags
-                "--disable-gpu",
-                "--single-process",
-                "--no-zygote",
-            ],
-            timeout=60000  # 60 second browser launch timeout
-        )
-        
-        # Build context options with browser profile (DataDome-aware)
-        context_options = {}
-        
-        if browser_profile:
-            context_options["user_agent"] = browser_profile.get("user_agent", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            if "viewport" in browser_profile:
-                context_options["viewport"] = browser_profile["viewport"]
-            if "timezone_id" in browser_profile:
-                context_options["timezone_id"] = browser_profile["timezone_id"]
-            if "locale" in browser_profile:
-                context_options["locale"] = browser_profile["locale"]
-            if "permissions" in browser_profile:
-                context_options["permissions"] = browser_profile["permissions"]
-            if "color_scheme" in browser_profile:
-                context_options["color_scheme"] = browser_profile["color_scheme"]
-            if "reduced_motion" in browser_profile:
-                context_options["reduced_motion"] = browser_profile["reduced_motion"]
-            if "forced_colors" in browser_profile:
-                context_options["forced_colors"] = browser_profile["forced_colors"]
-        else:
-            context_options["user_agent"] = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        
-        # Apply session data if provided
-        if session_data:
-            storage_state = session_data.get("storage_state")
-            cookies = session_data.get("cookies", [])
-            
-            if storage_state:
-                context_options["storage_state"] = storage_state
-                ctx = browser.new_context(**context_options)
-            else:
-                ctx = browser.new_context(**context_options)
-                if cookies:
-                    ctx.add_cookies(cookies)
-        else:
-            ctx = browser.new_context(**context_options)
-        
-        # DataDome evasion: stealth scripts
-        ctx.add_init_script("""
-            // Remove webdriver property
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Add chrome object
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-            
-            // Fix permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: 'prompt' }) :
-                    originalQuery(parameters)
-            );
-            
-            // Plugin array with realistic plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [
-                    {name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer'},
-                    {name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai'},
-                    {name: 'Native Client', filename: 'internal-nacl-plugin'}
-                ]
-            });
-            
-            // Languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            
-            // Hardware concurrency
-            Object.defineProperty(navigator, 'hardwareConcurrency', {
-                get: () => 8
-            });
-            
-            // Device memory
-            Object.defineProperty(navigator, 'deviceMemory', {
-                get: () => 8
-            });
-            
-            // Connection
-            Object.defineProperty(navigator, 'connection', {
-                get: () => ({
-                    effectiveType: '4g',
-                    rtt: 100,
-                    downlink: 10,
-                    saveData: false
-                })
-            });
-        """)
-        
+    try:
         page = ctx.new_page()
         page.set_default_navigation_timeout(settings.browser_nav_timeout_ms)
 
-        # DataDome timing: add realistic delay before navigation
-        import time
-        import random
-        time.sleep(random.uniform(0.3, 0.8))  # Random 300-800ms delay simulates human behavior
+        if humanize:
+            # DataDome timing: add realistic delay before navigation
+            time.sleep(random.uniform(0.3, 0.8))  # Random 300-800ms delay simulates human behavior
         
-        resp = page.goto(url, wait_until="networkidle")  # Wait for full page load
+        # The HTML (and JSON-LD) is usable once the DOM is parsed; waiting
+        # for networkidle on ad-heavy pages cost seconds for nothing
+        resp = page.goto(url, wait_until="domcontentloaded")
         status = resp.status if resp else 0
 
         # Basic anti-bot detection surface: if navigation fails, raise
         if status in (401, 403, 429):
             raise RuntimeError(f"blocked:Blocked (HTTP {status})")
 
-        # Simulate human-like behavior: random small mouse movements and scrolling
-        try:
-            # Move mouse to random positions (simulates human looking at content)
-            page.mouse.move(random.randint(100, 400), random.randint(100, 300))
-            time.sleep(random.uniform(0.1, 0.3))
-            
-            # Small scroll down (humans often scroll a bit)
-            page.evaluate("window.scrollBy(0, 100)")
-            time.sleep(random.uniform(0.2, 0.5))
-        except Exception:
-            pass  # Not critical if this fails
+        # CRITICAL: Check for JSON-LD structured data (FastPeopleSearch, etc.)
+        # If it's already in the DOM, go straight to it
+        jsonld_data = None
+        if _wait_for_jsonld(page):
+            jsonld_data = _extract_jsonld_from_blobs(page.evaluate(_JSONLD_BLOBS_JS), url)
 
-        # Handle common modal checkboxes (ThatsThem, ZabaSearch FCRA agreements)
-        try:
-            # Wait a bit for modals to appear
-            time.sleep(random.uniform(0.5, 1.0))
-            
-            # Try to click "I Agree" style buttons/checkboxes
-            agree_selectors = [
-                "#checkbox",  # ZabaSearch checkbox
-                "div.verify",  # ZabaSearch verify button
-                "button:has-text('I Agree')",
-                "button:has-text('I AGREE')",
-                "button:has-text('Accept')",
-                "input[type='checkbox'][id*='agree']",
-                "input[type='checkbox'][id*='consent']",
-            ]
-            
-            for selector in agree_selectors:
-                try:
-                    element = page.locator(selector).first
-                    if element.is_visible(timeout=2000):
-                        logger.info(f"✅ Found agreement element: {selector}, clicking...")
-                        # Move mouse to element first (more human-like)
-                        box = element.bounding_box()
-                        if box:
-                            page.mouse.move(
-                                box['x'] + box['width'] / 2,
-                                box['y'] + box['height'] / 2
-                            )
-                            time.sleep(random.uniform(0.1, 0.3))
-                        element.click(timeout=2000)
-                        time.sleep(random.uniform(0.5, 1.0))  # Human-like delay after click
-                        # Wait for page to update after modal dismissal
-                        page.wait_for_load_state("networkidle", timeout=5000)
-                        break
-                except Exception:
-                    continue  # Try next selector
-        except Exception as e:
-            logger.debug(f"No modal found or already dismissed: {e}")
+        if not jsonld_data:
+            _simulate_visitor(page, humanize)
+            _wait_for_fields(page, plan)
+            jsonld_data = _extract_jsonld_from_blobs(page.evaluate(_JSONLD_BLOBS_JS), url)
 
-        # CRITICAL: Check for JSON-LD structured data (FastPeopleSearch, etc.)
-        html = page.content()
-        jsonld_data = _extract_jsonld_if_present(html, url)
         if jsonld_data:
             # JSON-LD found - use structured data instead of CSS selectors
             
             # Capture session state before closing (if this was a new session)
             if not is_reused_session:
-                try:
-                    captured_cookies = ctx.cookies()
-                    captured_storage = ctx.storage_state()
-                    
-                    session_mgr.create_session(
-                        site_domain=site_domain,
-                        cookies=captured_cookies,
-                        storage_state=captured_storage,
-                        proxy_identity=None,
-                        user_agent=context_options.get("user_agent"),
-                        viewport=context_options.get("viewport")
-                    )
-                    logger.info(f"💾 Captured session state for {site_domain} (JSON-LD path)")
-                except Exception as e:
-                    logger.warning(f"Failed to capture session state: {e}")
+                _capture_session(ctx, page, session_mgr, site_domain, context_options, "JSON-LD path")
             
-            ctx.close()
-            browser.close()
+            healthy = True
             return jsonld_data
 
         record: Dict[str, Any] = {"_meta": {"url": url, "status": status, "engine": "playwright"}}
 
-        for field_name, spec in field_map.items():
-            css = spec.get("css", "")
-            if not css:
-                record[field_name] = None
-                continue
-
-            attr = spec.get("attr")
-            want_all = bool(spec.get("all", False))
-
-            if want_all:
-                loc = page.locator(css)
-                count = loc.count()
-                vals: List[Any] = []
-                for i in range(count):
-                    el = loc.nth(i)
-                    if attr:
-                        v = el.get_attribute(attr)
-                    else:
-                        v = el.inner_text()
-                    if v is not None:
-                        v = v.strip()
-                    if v:
-                        vals.append(v)
-                record[field_name] = vals
-            else:
-                loc = page.locator(css).first
-                if attr:
-                    v = loc.get_attribute(attr)
-                else:
-                    v = loc.inner_text()
-                if v is not None:
-                    v = v.strip()
-                record[field_name] = v or None
+        # All fields in one round-trip instead of locator/count/nth calls per match
+        record.update(_extract_fields_in_page(page, plan))
 
         # Capture session state for reuse (if this was a new session)
         if not is_reused_session:
-            try:
-                captured_cookies = ctx.cookies()
-                captured_storage = ctx.storage_state()
-                
-                # Store session for future reuse
-                session_mgr.create_session(
-                    site_domain=site_domain,
-                    cookies=captured_cookies,
-                    storage_state=captured_storage,
-                    proxy_identity=None,  # Will be passed when proxy support added
-                    user_agent=context_options.get("user_agent"),
-                    viewport=context_options.get("viewport")
-                )
-                logger.info(f"💾 Captured session state for {site_domain} (for future reuse)")
-            except Exception as e:
-                logger.warning(f"Failed to capture session state: {e}")
-        
-        ctx.close()
-        browser.close()
+            _capture_session(ctx, page, session_mgr, site_domain, context_options, "for future reuse")
 
+        healthy = True
         return [record]
+    finally:
+        if page is not None:
+            try:
+                page.close()
+            except Exception:
+                healthy = False
+        _release_context(pool_key, entry, healthy)
@@ -16,20 +16,31 @@ Features:
 
 from __future__ import annotations
 
+import atexit
+import heapq
+import math
 import time
 import logging
 import json
 import os
+import queue
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime, timezone
-from threading import Lock
+from contextlib import contextmanager
+from threading import Condition, Lock, Thread
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserSession:
     """
     A reusable browser session with trust tracking.
@@ -42,13 +53,18 @@ class BrowserSession:
     cookies: list[Dict[str, Any]]
     storage_state: Optional[Dict[str, Any]]
     
-    # Lifecycle tracking
-    first_seen_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_success_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Lifecycle tracking (epoch seconds; persisted as ISO strings)
+    first_seen_ts: float = field(default_factory=time.time)
+    last_success_ts: float = field(default_factory=time.time)
     failure_streak: int = 0
     total_uses: int = 0
     captcha_count: int = 0  # Track captcha encounters
     
+    # Trust was trust_at_anchor at trust_anchor_ts (epoch seconds) and
+    # decays exponentially from there; successes and failures re-anchor it
+    trust_at_anchor: float = 100.0
+    trust_anchor_ts: float = field(default_factory=time.time)
+    
     # Metadata
     user_agent: Optional[str] = None
     viewport: Optional[Dict[str, int]] = None
@@ -57,16 +73,16 @@ class BrowserSession:
         """Unique key for this session (site_domain, proxy_identity)"""
         return (self.site_domain, self.proxy_identity or "default")
     
-    def age_minutes(self) -> float:
-        """Age of session in minutes"""
-        return (datetime.now(timezone.utc) - self.first_seen_time).total_seconds() / 60
+    def age_minutes(self, now: Optional[float] = None) -> float:
+        """Age of session in minutes (now: epoch seconds, default current time)"""
+        return ((time.time() if now is None else now) - self.first_seen_ts) / 60
     
-    def minutes_since_success(self) -> float:
-        """Minutes since last successful use"""
-        return (datetime.now(timezone.utc) - self.last_success_time).total_seconds() / 60
+    def minutes_since_success(self, now: Optional[float] = None) -> float:
+        """Minutes since last successful use (now: epoch seconds, default current time)"""
+        return ((time.time() if now is None else now) - self.last_success_ts) / 60
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteCircuitBreaker:
     """
     Circuit breaker to prevent IP/account reputation damage.
@@ -100,6 +116,104 @@ class SiteCircuitBreaker:
         return minutes_since > cooldown_minutes
 
 
+class _RWLock:
+    """
+    Readers-writer lock: any number of readers, or one writer.
+    
+    A waiting writer holds off new readers, so a steady stream of lookups
+    can't starve session creation/retirement.
+    """
+    
+    def __init__(self):
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+    
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+    
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class _SessionShard:
+    """
+    One slice of the session pool, with its own lock.
+    
+    Keeps running sums over its sessions (in step with sessions via
+    add/remove, so get_stats needn't walk every session) and a retirement
+    heap of (retire-at epoch, session_key, first_seen_ts), so
+    cleanup_expired pops only sessions that may be due. Entries of replaced
+    or retired sessions are skipped when popped.
+    
+    Also tracks when each session was last written to disk, and the
+    sessions with successes not yet written (see PERSIST_DEBOUNCE_SECONDS).
+    """
+    
+    __slots__ = (
+        "lock", "sessions", "first_seen_sum", "uses_sum", "captcha_sum", "retire_heap",
+        "persisted_at", "dirty",
+    )
+    
+    def __init__(self):
+        # Lookups and stats share, changes are exclusive
+        self.lock = _RWLock()
+        self.sessions: Dict[Tuple[str, str], BrowserSession] = {}
+        self.first_seen_sum = 0.0  # epoch seconds
+        self.uses_sum = 0
+        self.captcha_sum = 0
+        self.retire_heap: list[Tuple[float, Tuple[str, str], float]] = []
+        self.persisted_at: Dict[Tuple[str, str], float] = {}  # epoch seconds
+        self.dirty: Dict[Tuple[str, str], BrowserSession] = {}
+    
+    def add(self, session_key: Tuple[str, str], session: BrowserSession, retire_at: float):
+        """Store a session and account for it (caller holds the write lock)"""
+        self.remove(session_key)
+        self.sessions[session_key] = session
+        self.first_seen_sum += session.first_seen_ts
+        self.uses_sum += session.total_uses
+        self.captcha_sum += session.captcha_count
+        self.schedule_retirement(session_key, session, retire_at)
+    
+    def schedule_retirement(self, session_key: Tuple[str, str], session: BrowserSession, retire_at: float):
+        """Queue a retirement check for session at retire_at (caller holds the write lock)"""
+        heapq.heappush(self.retire_heap, (retire_at, session_key, session.first_seen_ts))
+    
+    def remove(self, session_key: Tuple[str, str]):
+        """Drop a session and its share of the running sums (caller holds the write lock)"""
+        session = self.sessions.pop(session_key, None)
+        self.persisted_at.pop(session_key, None)
+        self.dirty.pop(session_key, None)
+        if session is not None:
+            self.first_seen_sum -= session.first_seen_ts
+            self.uses_sum -= session.total_uses
+            self.captcha_sum -= session.captcha_count
+
+
 class SessionLifecycleManager:
     """
     Manages browser session lifecycle with trust-based reuse.
@@ -109,8 +223,9 @@ class SessionLifecycleManager:
     
     Trust scoring:
     - Fresh sessions start at 100
-    - Age, failures, and overuse decay trust
-    - Recent success boosts trust
+    - Trust decays exponentially with time; failures cut it, overuse
+      penalizes it
+    - Success boosts trust
     - Sessions with trust < 40 are retired
     
     Features:
@@ -133,6 +248,12 @@ class SessionLifecycleManager:
     MAX_USES = 100          # Soft limit before aggressive decay
     HARD_CAP_USES = 200     # Hard limit - always retire
     
+    # Trust decay: trust(t) = trust_at_anchor * exp(-TRUST_DECAY_PER_MINUTE * minutes since anchor).
+    # The rate takes an untouched fresh session to TRUST_RETIRED at MAX_AGE_MINUTES.
+    TRUST_DECAY_PER_MINUTE = math.log(100 / TRUST_RETIRED) / MAX_AGE_MINUTES
+    SUCCESS_BOOST = 20      # Added to decayed trust on success (capped at 100)
+    FAILURE_FACTOR = 0.85   # Decayed trust is multiplied by this on failure
+    
     # Circuit breaker
     CIRCUIT_FAILURE_THRESHOLD = 10  # Consecutive failures before breaking
     CIRCUIT_COOLDOWN_MINUTES = 30   # How long to wait before retry
@@ -140,6 +261,12 @@ class SessionLifecycleManager:
     # Persistence
     PERSISTENCE_DIR = ".sessions"
     MAX_PERSISTED_AGE_HOURS = 24  # Don't load sessions older than this
+    PERSIST_DEBOUNCE_SECONDS = 10  # Write a session at most this often on success
+    PERSIST_BATCH_SECONDS = 0.5    # Writer thread gathers queued sessions this long
+    
+    # Sessions are spread over this many independently locked shards, so
+    # threads working on different sites don't serialize on one pool lock
+    SHARD_COUNT = 32
     
     def __init__(self, enable_persistence: bool = True):
         """
@@ -148,9 +275,10 @@ class SessionLifecycleManager:
         Args:
             enable_persistence: Load/save sessions to disk
         """
-        self._sessions: Dict[Tuple[str, str], BrowserSession] = {}
+        self._shards = [_SessionShard() for _ in range(self.SHARD_COUNT)]
         self._circuit_breakers: Dict[str, SiteCircuitBreaker] = {}
-        self._lock = Lock()  # Thread-safe access
+        # Sites whose breaker is open; get_session checks only this
+        self._open_circuits: set[str] = set()
         self._enable_persistence = enable_persistence
         
         # Stats tracking
@@ -160,9 +288,20 @@ class SessionLifecycleManager:
         # Load persisted sessions
         if enable_persistence:
             self._load_persisted_sessions()
+            # Disk writes happen on one background thread, off the scraping
+            # threads and outside the shard locks
+            self._write_q: queue.Queue[BrowserSession] = queue.Queue()
+            self._writer = Thread(target=self._writer_loop, name="session-writer", daemon=True)
+            self._writer.start()
+            # Write out successes still inside the debounce window
+            atexit.register(self.flush_all)
         
         logger.info(f"🔄 SessionLifecycleManager initialized (persistence={enable_persistence})")
     
+    def _shard(self, session_key: Tuple[str, str]) -> _SessionShard:
+        """Shard holding the session for session_key"""
+        return self._shards[hash(session_key) % self.SHARD_COUNT]
+    
     def get_session(
         self,
         site_domain: str,
@@ -182,46 +321,44 @@ class SessionLifecycleManager:
         """
         # Check circuit breaker first
         if self._is_circuit_open(site_domain):
-            logger.warning(
-                f"⚡ Circuit breaker OPEN for {site_domain} "
-                f"(too many failures, cooling down)"
-            )
+            logger.warning("⚡ Circuit breaker OPEN for %s (too many failures, cooling down)", site_domain)
             return None
         
         session_key = (site_domain, proxy_identity or "default")
+        shard = self._shard(session_key)
         
-        with self._lock:
-            if session_key not in self._sessions:
+        with shard.lock.read():
+            session = shard.sessions.get(session_key)
+            if session is None:
                 return None
             
-            session = self._sessions[session_key]
-            trust_breakdown = self._calculate_trust_breakdown(session)
-            trust = trust_breakdown["total_trust"]
+            now = time.time()
+            trust = self._calculate_trust(session, now)
             
-            # Check hard cap (always retire)
-            if session.total_uses >= self.HARD_CAP_USES:
+            # Check if session is still trustworthy
+            if session.total_uses < self.HARD_CAP_USES and trust >= self.TRUST_DEGRADED:
                 logger.info(
-                    f"🚫 Hard cap reached for {site_domain} "
-                    f"(uses={session.total_uses} >= {self.HARD_CAP_USES})"
+                    "♻️ Reusing session for %s (trust=%.0f, age=%.1fm, uses=%d, streak=%d)",
+                    site_domain, trust, session.age_minutes(now), session.total_uses, session.failure_streak
                 )
-                del self._sessions[session_key]
+                return session
+        
+        # Retiring needs the write lock; only retire the session judged above,
+        # in case another thread replaced it in between
+        with shard.lock.write():
+            if shard.sessions.get(session_key) is not session:
                 return None
             
-            # Check if session is still trustworthy
-            if trust >= self.TRUST_DEGRADED:
+            # Check hard cap (always retire)
+            if session.total_uses >= self.HARD_CAP_USES:
                 logger.info(
-                    f"♻️ Reusing session for {site_domain} "
-                    f"(trust={trust:.0f}, age={session.age_minutes():.1f}m, "
-                    f"uses={session.total_uses}, streak={session.failure_streak})"
+                    "🚫 Hard cap reached for %s (uses=%d >= %d)",
+                    site_domain, session.total_uses, self.HARD_CAP_USES
                 )
-                return session
             else:
-                logger.info(
-                    f"🔄 Retiring session for {site_domain} "
-                    f"(trust={trust:.0f} < {self.TRUST_RETIRED})"
-                )
-                del self._sessions[session_key]
-                return None
+                logger.info("🔄 Retiring session for %s (trust=%.0f < %d)", site_domain, trust, self.TRUST_RETIRED)
+            shard.remove(session_key)
+            return None
     
     def create_session(
         self,
@@ -257,10 +394,11 @@ class SessionLifecycleManager:
         
         session_key = session.session_key()
         
-        with self._lock:
-            self._sessions[session_key] = session
+        shard = self._shard(session_key)
+        with shard.lock.write():
+            self._add_session(shard, session_key, session)
         
-        logger.info(f"🆕 Created new session for {site_domain} (key={session_key})")
+        logger.info("🆕 Created new session for %s (key=%s)", site_domain, session_key)
         return session
     
     def mark_success(
@@ -286,26 +424,41 @@ class SessionLifecycleManager:
         if had_captcha:
             self._total_captchas += 1
         
-        with self._lock:
-            if session_key in self._sessions:
-                session = self._sessions[session_key]
-                session.last_success_time = datetime.now(timezone.utc)
+        shard = self._shard(session_key)
+        with shard.lock.write():
+            session = shard.sessions.get(session_key)
+            if session is not None:
+                now = time.time()
+                retire_at = self._retire_at(session)
+                session.last_success_ts = now
                 session.failure_streak = 0  # Reset failures
+                session.trust_at_anchor = min(100.0, self._decayed_trust(session, now) + self.SUCCESS_BOOST)
+                session.trust_anchor_ts = now
                 session.total_uses += 1
+                shard.uses_sum += 1
+                self._reschedule(shard, session_key, session, retire_at)
                 
                 if had_captcha:
                     session.captcha_count += 1
+                    shard.captcha_sum += 1
                 
-                trust_breakdown = self._calculate_trust_breakdown(session)
-                trust = trust_breakdown["total_trust"]
-                logger.info(
-                    f"✅ Session success for {site_domain} "
-                    f"(trust={trust:.0f}, uses={session.total_uses}, captcha={had_captcha})"
-                )
+                # Trust is only needed for the log line
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "✅ Session success for %s (trust=%.0f, uses=%d, captcha=%s)",
+                        site_domain, self._calculate_trust(session, now), session.total_uses, had_captcha
+                    )
                 
-                # Persist session after success
+                # Persist session after success, at most once per debounce
+                # window; trust is recomputed on load, so a few seconds of
+                # staleness on disk is harmless. flush_all writes the rest.
                 if self._enable_persistence:
-                    self._persist_session(session)
+                    if now - shard.persisted_at.get(session_key, 0.0) > self.PERSIST_DEBOUNCE_SECONDS:
+                        self._queue_persist(session)
+                        shard.persisted_at[session_key] = now
+                        shard.dirty.pop(session_key, None)
+                    else:
+                        shard.dirty[session_key] = session
         
         # Reset circuit breaker on success
         self._record_site_success(site_domain)
@@ -326,89 +479,128 @@ class SessionLifecycleManager:
         # Track request (even failures)
         self._total_requests += 1
         
-        with self._lock:
-            if session_key in self._sessions:
-                session = self._sessions[session_key]
+        shard = self._shard(session_key)
+        with shard.lock.write():
+            session = shard.sessions.get(session_key)
+            if session is not None:
+                now = time.time()
+                retire_at = self._retire_at(session)
                 session.failure_streak += 1
+                session.trust_at_anchor = self._decayed_trust(session, now) * self.FAILURE_FACTOR
+                session.trust_anchor_ts = now
                 session.total_uses += 1
-                
-                trust_breakdown = self._calculate_trust_breakdown(session)
-                trust = trust_breakdown["total_trust"]
+                shard.uses_sum += 1
                 
                 # Auto-retire if too many failures
                 if session.failure_streak >= self.MAX_FAILURE_STREAK:
                     logger.warning(
-                        f"🚫 Auto-retiring session for {site_domain} "
-                        f"({session.failure_streak} consecutive failures)"
+                        "🚫 Auto-retiring session for %s (%d consecutive failures)",
+                        site_domain, session.failure_streak
                     )
-                    del self._sessions[session_key]
+                    shard.remove(session_key)
                 else:
-                    logger.info(
-                        f"⚠️ Session failure for {site_domain} "
-                        f"(trust={trust:.0f}, streak={session.failure_streak})"
-                    )
+                    self._reschedule(shard, session_key, session, retire_at)
+                    # Trust is only needed for the log line
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "⚠️ Session failure for %s (trust=%.0f, streak=%d)",
+                            site_domain, self._calculate_trust(session, now), session.failure_streak
+                        )
         
         # Update circuit breaker
         self._record_site_failure(site_domain)
     
-    def _calculate_trust_breakdown(self, session: BrowserSession) -> Dict[str, float]:
+    def _add_session(self, shard: _SessionShard, session_key: Tuple[str, str], session: BrowserSession):
+        """Store a session in its shard (caller holds the shard's write lock)"""
+        shard.add(session_key, session, self._retire_at(session))
+    
+    def _reschedule(self, shard: _SessionShard, session_key: Tuple[str, str], session: BrowserSession, old_retire_at: float):
+        """
+        Queue a retirement check if an update moved session's retire time
+        earlier than old_retire_at (caller holds the shard's write lock).
+        
+        A later retire time needs no new entry: cleanup_expired re-queues a
+        session that turns out not to be due when its old entry pops.
+        """
+        retire_at = self._retire_at(session)
+        if retire_at < old_retire_at:
+            shard.schedule_retirement(session_key, session, retire_at)
+    
+    def _usage_penalty(self, uses: int) -> float:
+        """Trust penalty for overuse of a session"""
+        penalty = uses - 50 if uses > 50 else 0
+        if uses > self.MAX_USES:
+            penalty += 50  # Aggressive decay
+        return penalty
+    
+    def _decayed_trust(self, session: BrowserSession, now: float) -> float:
+        """Anchor trust decayed to now, before the usage penalty"""
+        minutes = (now - session.trust_anchor_ts) / 60
+        return session.trust_at_anchor * math.exp(-self.TRUST_DECAY_PER_MINUTE * minutes)
+    
+    def _retire_at(self, session: BrowserSession) -> float:
+        """
+        Epoch time at which session's trust falls below TRUST_RETIRED if
+        nothing else happens to it, capped at the MAX_AGE_MINUTES limit.
+        
+        Solves trust_at_anchor * exp(-rate * minutes) = retirement floor
+        for minutes, so no clock-driven rescoring is needed to find it.
+        """
+        hard_limit = session.first_seen_ts + self.MAX_AGE_MINUTES * 60
+        floor = self.TRUST_RETIRED + self._usage_penalty(session.total_uses)
+        if session.trust_at_anchor <= floor:
+            return min(hard_limit, session.trust_anchor_ts)
+        minutes = math.log(session.trust_at_anchor / floor) / self.TRUST_DECAY_PER_MINUTE
+        return min(hard_limit, session.trust_anchor_ts + minutes * 60)
+    
+    def _calculate_trust(self, session: BrowserSession, now: Optional[float] = None) -> float:
+        """
+        Trust score alone, as total_trust of _calculate_trust_breakdown.
+        
+        The hot path (lookups, success/failure updates, stats scans), so it
+        builds no breakdown dict.
+        """
+        if now is None:
+            now = time.time()
+        if now - session.first_seen_ts > self.MAX_AGE_MINUTES * 60:
+            return 0.0
+        return max(0.0, self._decayed_trust(session, now) - self._usage_penalty(session.total_uses))
+    
+    def _calculate_trust_breakdown(self, session: BrowserSession, now: Optional[float] = None) -> Dict[str, float]:
         """
         Calculate trust score with observable breakdown.
         
-        Returns breakdown of penalties/bonuses for debugging.
+        Returns breakdown of penalties/bonuses for debugging; scoring code
+        should call _calculate_trust. now (epoch seconds) lets callers
+        scoring several sessions read the clock once.
         
         Returns:
             Dict with trust score and component breakdown
         """
-        base_trust = 100.0
-        age_penalty = 0.0
-        failure_penalty = 0.0
-        success_bonus = 0.0
-        usage_penalty = 0.0
-        
-        # Age penalty (sessions older than 1 hour decay)
-        age_minutes = session.age_minutes()
-        if age_minutes > 60:
-            age_penalty = (age_minutes - 60) * 0.5
+        if now is None:
+            now = time.time()
+        anchor_trust = session.trust_at_anchor
         
         # Hard age limit
-        if age_minutes > self.MAX_AGE_MINUTES:
+        if session.age_minutes(now) > self.MAX_AGE_MINUTES:
             return {
-                "base_trust": base_trust,
-                "age_penalty": -999,  # Signal hard limit
-                "failure_penalty": 0,
-                "success_bonus": 0,
+                "anchor_trust": anchor_trust,
+                "decay_penalty": -999,  # Signal hard limit
                 "usage_penalty": 0,
                 "total_trust": 0.0
             }
         
-        # Failure penalty (failures hurt trust)
-        failure_penalty = session.failure_streak * 15
-        
-        # Success bonus (recent success restores trust)
-        minutes_since_success = session.minutes_since_success()
-        if minutes_since_success < 5:
-            success_bonus = 20
+        # Decay since the last anchor (creation, success or failure)
+        decayed = self._decayed_trust(session, now)
         
         # Usage penalty (don't overuse same session)
-        if session.total_uses > 50:
-            usage_penalty = (session.total_uses - 50) * 1
-        
-        # Hard usage limit
-        if session.total_uses > self.MAX_USES:
-            usage_penalty += 50  # Aggressive decay
-        
-        # Calculate final trust
-        total_trust = base_trust - age_penalty - failure_penalty + success_bonus - usage_penalty
-        total_trust = max(0.0, min(100.0, total_trust))
+        usage_penalty = self._usage_penalty(session.total_uses)
         
         return {
-            "base_trust": base_trust,
-            "age_penalty": -age_penalty,
-            "failure_penalty": -failure_penalty,
-            "success_bonus": success_bonus,
+            "anchor_trust": anchor_trust,
+            "decay_penalty": decayed - anchor_trust,
             "usage_penalty": -usage_penalty,
-            "total_trust": total_trust
+            "total_trust": max(0.0, decayed - usage_penalty)
         }
     
     def get_stats(self) -> Dict[str, Any]:
@@ -420,124 +612,160 @@ class SessionLifecycleManager:
         Returns:
             Dict with pool stats
         """
-        with self._lock:
-            total_sessions = len(self._sessions)
-            
-            # Calculate captcha rate (key KPI)
-            captcha_rate = (self._total_captchas / self._total_requests * 100) if self._total_requests > 0 else 0
-            
-            if total_sessions == 0:
-                return {
-                    "total_sessions": 0,
-                    "healthy_sessions": 0,
-                    "degraded_sessions": 0,
-                    "avg_age_minutes": 0,
-                    "avg_uses": 0,
-                    "captcha_rate_pct": round(captcha_rate, 2),
-                    "total_requests": self._total_requests,
-                    "total_captchas": self._total_captchas,
-                    "circuit_breakers_open": len([cb for cb in self._circuit_breakers.values() if cb.is_open])
-                }
-            
-            healthy = 0
-            degraded = 0
-            total_age = 0
-            total_uses = 0
-            total_captchas = 0
-            
-            # Sample trust breakdown (first session for observability)
-            sample_trust_breakdown = None
-            
-            for i, session in enumerate(self._sessions.values()):
-                trust_breakdown = self._calculate_trust_breakdown(session)
-                trust = trust_breakdown["total_trust"]
-                
-                if trust >= self.TRUST_HEALTHY:
-                    healthy += 1
-                elif trust >= self.TRUST_DEGRADED:
-                    degraded += 1
-                
-                total_age += session.age_minutes()
-                total_uses += session.total_uses
-                total_captchas += session.captcha_count
-                
-                # Capture first session's trust breakdown as sample
-                if i == 0:
-                    sample_trust_breakdown = trust_breakdown
-            
+        now = time.time()
+        total_sessions = 0
+        first_seen_sum = 0.0
+        total_uses = 0
+        total_captchas = 0
+        sessions = []
+        # One shard locked at a time; the totals needn't be an atomic
+        # snapshot of the whole pool
+        for shard in self._shards:
+            with shard.lock.read():
+                total_sessions += len(shard.sessions)
+                first_seen_sum += shard.first_seen_sum
+                total_uses += shard.uses_sum
+                total_captchas += shard.captcha_sum
+                # Trust depends on the clock, so it can't be kept as a running
+                # count; score a snapshot outside the lock instead
+                sessions.extend(shard.sessions.values())
+        total_age = total_sessions * now - first_seen_sum
+        
+        # Calculate captcha rate (key KPI)
+        captcha_rate = (self._total_captchas / self._total_requests * 100) if self._total_requests > 0 else 0
+        
+        if total_sessions == 0:
             return {
-                "total_sessions": total_sessions,
-                "healthy_sessions": healthy,
-                "degraded_sessions": degraded,
-                "avg_age_minutes": round(total_age / total_sessions, 2),
-                "avg_uses": round(total_uses / total_sessions, 2),
-                "avg_captchas_per_session": round(total_captchas / total_sessions, 2),
+                "total_sessions": 0,
+                "healthy_sessions": 0,
+                "degraded_sessions": 0,
+                "avg_age_minutes": 0,
+                "avg_uses": 0,
                 "captcha_rate_pct": round(captcha_rate, 2),
                 "total_requests": self._total_requests,
                 "total_captchas": self._total_captchas,
-                "circuit_breakers_open": len([cb for cb in self._circuit_breakers.values() if cb.is_open]),
-                "sample_trust_breakdown": sample_trust_breakdown  # For debugging
+                "circuit_breakers_open": len(self._open_circuits)
             }
+        
+        healthy = 0
+        degraded = 0
+        
+        for session in sessions:
+            trust = self._calculate_trust(session, now)
+            
+            if trust >= self.TRUST_HEALTHY:
+                healthy += 1
+            elif trust >= self.TRUST_DEGRADED:
+                degraded += 1
+        
+        # Capture first session's trust breakdown as sample
+        sample_trust_breakdown = self._calculate_trust_breakdown(sessions[0], now)
+        
+        return {
+            "total_sessions": total_sessions,
+            "healthy_sessions": healthy,
+            "degraded_sessions": degraded,
+            "avg_age_minutes": round(total_age / 60 / total_sessions, 2),
+            "avg_uses": round(total_uses / total_sessions, 2),
+            "avg_captchas_per_session": round(total_captchas / total_sessions, 2),
+            "captcha_rate_pct": round(captcha_rate, 2),
+            "total_requests": self._total_requests,
+            "total_captchas": self._total_captchas,
+            "circuit_breakers_open": len(self._open_circuits),
+            "sample_trust_breakdown": sample_trust_breakdown  # For debugging
+        }
     
     def cleanup_expired(self):
         """
         Remove expired sessions from pool.
         
-        Called periodically to prevent memory bloat.
+        Called periodically to prevent memory bloat. Pops only sessions due
+        off the retirement heap: trust decayed below TRUST_RETIRED or past
+        MAX_AGE_MINUTES. One found not yet due (a success since pushed its
+        retire time back) is re-queued at its new time.
         """
-        with self._lock:
-            expired_keys = []
-            
-            for session_key, session in self._sessions.items():
-                trust_breakdown = self._calculate_trust_breakdown(session)
-                trust = trust_breakdown["total_trust"]
-                if trust < self.TRUST_RETIRED:
-                    expired_keys.append(session_key)
-            
-            for key in expired_keys:
-                del self._sessions[key]
-            
-            if expired_keys:
-                logger.info(f"🧹 Cleaned up {len(expired_keys)} expired sessions")
+        now = time.time()
+        expired = 0
+        for shard in self._shards:
+            heap = shard.retire_heap
+            with shard.lock.write():
+                while heap and heap[0][0] < now:
+                    _, session_key, first_seen_ts = heapq.heappop(heap)
+                    session = shard.sessions.get(session_key)
+                    # Skip entries left by a session since retired or replaced
+                    if session is None or session.first_seen_ts != first_seen_ts:
+                        continue
+                    retire_at = self._retire_at(session)
+                    if retire_at < now:
+                        shard.remove(session_key)
+                        expired += 1
+                    else:
+                        shard.schedule_retirement(session_key, session, retire_at)
+        
+        if expired:
+            logger.info("🧹 Cleaned up %d expired sessions", expired)
+    
+    def flush_all(self):
+        """
+        Persist sessions whose last successes were debounced, and wait for
+        the writer thread to finish everything queued.
+        
+        Registered with atexit when persistence is enabled.
+        """
+        if not self._enable_persistence:
+            return
+        
+        now = time.time()
+        for shard in self._shards:
+            with shard.lock.write():
+                for session_key, session in shard.dirty.items():
+                    self._queue_persist(session)
+                    shard.persisted_at[session_key] = now
+                shard.dirty.clear()
+        self._write_q.join()
     
     # Circuit breaker methods
     
     def _is_circuit_open(self, site_domain: str) -> bool:
         """Check if circuit breaker is open for site"""
-        if site_domain not in self._circuit_breakers:
+        # Breakers open in _record_site_failure, so a site not in the open
+        # set needs no breaker lookup at all
+        if site_domain not in self._open_circuits:
             return False
         
         breaker = self._circuit_breakers[site_domain]
         
-        # Check if should open
-        if breaker.should_open(self.CIRCUIT_FAILURE_THRESHOLD):
-            breaker.is_open = True
-            logger.warning(
-                f"⚡ Circuit breaker OPENED for {site_domain} "
-                f"({breaker.consecutive_failures} consecutive failures)"
-            )
-            return True
-        
         # Check if should close (cooldown expired)
-        if breaker.is_open and breaker.should_close(self.CIRCUIT_COOLDOWN_MINUTES):
+        if breaker.should_close(self.CIRCUIT_COOLDOWN_MINUTES):
             breaker.is_open = False
             breaker.consecutive_failures = 0
-            logger.info(f"✅ Circuit breaker CLOSED for {site_domain} (cooldown expired)")
+            self._open_circuits.discard(site_domain)
+            logger.info("✅ Circuit breaker CLOSED for %s (cooldown expired)", site_domain)
             return False
         
-        return breaker.is_open
+        return True
     
     def _record_site_success(self, site_domain: str):
         """Record success for circuit breaker"""
-        if site_domain in self._circuit_breakers:
-            self._circuit_breakers[site_domain].record_success()
+        breaker = self._circuit_breakers.get(site_domain)
+        if breaker is not None:
+            breaker.record_success()
+            self._open_circuits.discard(site_domain)
     
     def _record_site_failure(self, site_domain: str):
-        """Record failure for circuit breaker"""
-        if site_domain not in self._circuit_breakers:
-            self._circuit_breakers[site_domain] = SiteCircuitBreaker(site_domain=site_domain)
+        """Record failure for circuit breaker, opening it at the threshold"""
+        breaker = self._circuit_breakers.get(site_domain)
+        if breaker is None:
+            breaker = self._circuit_breakers.setdefault(site_domain, SiteCircuitBreaker(site_domain=site_domain))
         
-        self._circuit_breakers[site_domain].record_failure()
+        breaker.record_failure()
+        if not breaker.is_open and breaker.should_open(self.CIRCUIT_FAILURE_THRESHOLD):
+            breaker.is_open = True
+            self._open_circuits.add(site_domain)
+            logger.warning(
+                "⚡ Circuit breaker OPENED for %s (%d consecutive failures)",
+                site_domain, breaker.consecutive_failures
+            )
     
     # Persistence methods
     
@@ -553,15 +781,18 @@ class SessionLifecycleManager:
             
             for session_file in persist_dir.glob("*.json"):
                 try:
-                    with open(session_file, 'r') as f:
-                        data = json.load(f)
+                    with open(session_file, 'rb') as f:
+                        raw = f.read()
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     
-                    # Convert datetime strings back to datetime objects
-                    data["first_seen_time"] = datetime.fromisoformat(data["first_seen_time"])
-                    data["last_success_time"] = datetime.fromisoformat(data["last_success_time"])
+                    # Files written before timestamps were stored as epoch
+                    # seconds carry ISO datetime strings instead
+                    if "first_seen_time" in data:
+                        data["first_seen_ts"] = datetime.fromisoformat(data.pop("first_seen_time")).timestamp()
+                        data["last_success_ts"] = datetime.fromisoformat(data.pop("last_success_time")).timestamp()
                     
                     # Check if too old
-                    age_hours = (datetime.now(timezone.utc) - data["first_seen_time"]).total_seconds() / 3600
+                    age_hours = (time.time() - data["first_seen_ts"]) / 3600
                     if age_hours > self.MAX_PERSISTED_AGE_HOURS:
                         expired_count += 1
                         session_file.unlink()  # Delete old session file
@@ -571,7 +802,7 @@ class SessionLifecycleManager:
                     session = BrowserSession(**data)
                     session_key = session.session_key()
                     
-                    self._sessions[session_key] = session
+                    self._add_session(self._shard(session_key), session_key, session)
                     loaded_count += 1
                     
                 except Exception as e:
@@ -584,8 +815,33 @@ class SessionLifecycleManager:
         except Exception as e:
             logger.warning(f"Failed to load persisted sessions: {e}")
     
+    def _queue_persist(self, session: BrowserSession):
+        """Hand a session to the writer thread (caller holds the shard's lock)"""
+        # Copy so the writer serializes this moment's counters rather than
+        # racing later updates; cookies/storage_state are replaced, never
+        # mutated, so they can be shared
+        self._write_q.put(replace(session))
+    
+    def _writer_loop(self):
+        """Writer thread: batch up queued sessions and write each key once"""
+        while True:
+            pending = [self._write_q.get()]
+            time.sleep(self.PERSIST_BATCH_SECONDS)
+            while True:
+                try:
+                    pending.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Later snapshots of a key supersede earlier ones
+            latest = {session.session_key(): session for session in pending}
+            for session in latest.values():
+                self._persist_session(session)
+            for _ in pending:
+                self._write_q.task_done()
+    
     def _persist_session(self, session: BrowserSession):
-        """Save session to disk"""
+        """Save session to disk (writer thread)"""
         try:
             persist_dir = Path(self.PERSISTENCE_DIR)
             persist_dir.mkdir(exist_ok=True)
@@ -595,14 +851,23 @@ class SessionLifecycleManager:
             filename = f"{session_key[0]}_{session_key[1]}.json"
             filepath = persist_dir / filename
             
-            # Convert to dict with datetime as ISO strings
-            data = asdict(session)
-            data["first_seen_time"] = session.first_seen_time.isoformat()
-            data["last_success_time"] = session.last_success_time.isoformat()
+            # orjson serializes the dataclass directly, without an asdict()
+            # copy of the cookies/storage_state first
+            if orjson is not None:
+                payload = orjson.dumps(session)
+            else:
+                payload = json.dumps(asdict(session), ensure_ascii=False).encode()
             
-            # Write to disk
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a temp file and rename it over the old one, so a
+            # crash mid-write never leaves a torn session file
+            fd, tmp_path = tempfile.mkstemp(dir=persist_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         
         except Exception as e:
             logger.warning(f"Failed to persist session: {e}")
@@ -1,8 +1,22 @@
 import scrapy
-from parsel import Selector
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit, urlunsplit
 from typing import Optional
-from app.scraping.extraction import extract_from_selector
+from app.scraping.extraction import compile_fields_extractor, compile_fields_plan
+
+
+def _canonical_url(url: str) -> str:
+    """URL without its fragment and with a lowercased host, for dedupe"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, parts.query, ""))
+
+
+def _absolute_url(base: str, base_scheme: str, href: str) -> str:
+    """urljoin(base, href), skipping the parse for already-absolute hrefs"""
+    if href.startswith(("https://", "http://")):
+        return href
+    if href.startswith("//"):
+        return f"{base_scheme}:{href}"
+    return urljoin(base, href)
 
 
 class GenericJobSpider(scrapy.Spider):
@@ -15,7 +29,15 @@ class GenericJobSpider(scrapy.Spider):
         self._crawl_mode = crawl_mode
         self._list_config = list_config or {}
 
-        self._seen_detail_urls = set()
+        # Compile every selector spec once per crawl rather than per page
+        self._extract_fields = compile_fields_extractor(compile_fields_plan(field_map))
+        self._extract_list = compile_fields_extractor(compile_fields_plan({
+            "item_links": self._list_config.get("item_links", {}),
+            "pagination": self._list_config.get("pagination", {}),
+        }))
+
+        # Canonical detail URLs already followed (bounded by max_items)
+        self._seen_detail_urls: set[str] = set()
         self._pages_crawled = 0
         self._items_emitted = 0
 
@@ -31,35 +53,34 @@ class GenericJobSpider(scrapy.Spider):
         max_pages = int(self._list_config.get("max_pages", 10))
         max_items = int(self._list_config.get("max_items", 500))
 
-        item_links_spec = self._list_config.get("item_links", {})
-        pagination_spec = self._list_config.get("pagination", {})
-
-        # 1) Extract detail URLs
-        sel = Selector(response.text)
-        links = extract_from_selector(sel, item_links_spec)
+        # 1) Extract detail URLs (response.selector parses the body once and caches it)
+        extracted = self._extract_list(response.selector)
+        links = extracted["item_links"]
         if links and not isinstance(links, list):
             links = [links]
         links = links or []
 
+        base_scheme = urlsplit(response.url).scheme
         for href in links:
             if self._items_emitted >= max_items:
                 break
-            abs_url = urljoin(response.url, href)
-            if abs_url in self._seen_detail_urls:
+            abs_url = _absolute_url(response.url, base_scheme, href)
+            canonical = _canonical_url(abs_url)
+            if canonical in self._seen_detail_urls:
                 continue
-            self._seen_detail_urls.add(abs_url)
+            self._seen_detail_urls.add(canonical)
             yield response.follow(abs_url, callback=self._parse_detail_page)
 
         # 2) Pagination
         if self._pages_crawled >= max_pages:
             return
 
-        next_href = extract_from_selector(sel, pagination_spec)
+        next_href = extracted["pagination"]
         if isinstance(next_href, list):
             next_href = next_href[0] if next_href else None
 
         if next_href:
-            next_url = urljoin(response.url, next_href)
+            next_url = _absolute_url(response.url, base_scheme, next_href)
             yield response.follow(next_url, callback=self.parse)
 
     def _parse_detail_page(self, response):
@@ -70,8 +91,6 @@ class GenericJobSpider(scrapy.Spider):
         yield item
 
     def _extract_detail(self, response):
-        sel = Selector(response.text)
         item = {"_meta": {"url": response.url, "status": response.status, "engine": "scrapy"}}
-        for field_name, spec in self._field_map.items():
-            item[field_name] = extract_from_selector(sel, spec)
+        item.update(self._extract_fields(response.selector))
         return item
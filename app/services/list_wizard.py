@@ -49,16 +49,16 @@ def validate_list_wizard(
     pagination: Optional[Dict[str, Any]],
     max_samples: int,
     prefer_browser: bool,
-) -> Tuple[str, int, List[str], Optional[str], List[str]]:
+) -> Tuple[str, int, Tuple[str, ...], Optional[str], Tuple[str, ...]]:
     """
     Validate list wizard selectors against a page.
     
     Returns:
         - fetched_via: "http" or "browser"
         - item_count_estimate: number of items matched
-        - sample_item_urls: list of sample item URLs (up to max_samples)
+        - sample_item_urls: sample item URLs (up to max_samples)
         - next_url: URL of next page (if pagination selector matched)
-        - warnings: list of warning messages
+        - warnings: warning messages
     """
     warnings: List[str] = []
 
@@ -74,10 +74,10 @@ def validate_list_wizard(
     if not item_urls:
         warnings.append("No item links matched. Check the item link selector.")
         item_count_estimate = 0
-        sample_item_urls = []
+        sample_item_urls = ()
     else:
         item_count_estimate = len(item_urls)
-        sample_item_urls = item_urls[:max_samples]
+        sample_item_urls = tuple(item_urls[:max_samples])
 
     # Extract next page link
     next_url: Optional[str] = None
@@ -87,4 +87,4 @@ def validate_list_wizard(
         if not next_url:
             warnings.append("Next page selector did not match a link with href.")
 
-    return fetched_via, item_count_estimate, sample_item_urls, next_url, warnings
+    return fetched_via, item_count_estimate, sample_item_urls, next_url, tuple(warnings)
@@ -9,11 +9,33 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from app.models.job import Job
 from app.models.field_map import FieldMap
-from app.people_search_sites import get_site_config
+from app.people_search_sites import (
+    resolve_site_id,
+    get_site_spec_by_id,
+    compile_url_template
+)
 import uuid
 import re
 
 
+# State code to full name (for ZabaSearch's {state_full})
+STATE_NAMES = {
+    "AL": "alabama", "AK": "alaska", "AZ": "arizona", "AR": "arkansas",
+    "CA": "california", "CO": "colorado", "CT": "connecticut", "DE": "delaware",
+    "FL": "florida", "GA": "georgia", "HI": "hawaii", "ID": "idaho",
+    "IL": "illinois", "IN": "indiana", "IA": "iowa", "KS": "kansas",
+    "KY": "kentucky", "LA": "louisiana", "ME": "maine", "MD": "maryland",
+    "MA": "massachusetts", "MI": "michigan", "MN": "minnesota", "MS": "mississippi",
+    "MO": "missouri", "MT": "montana", "NE": "nebraska", "NV": "nevada",
+    "NH": "new-hampshire", "NJ": "new-jersey", "NM": "new-mexico", "NY": "new-york",
+    "NC": "north-carolina", "ND": "north-dakota", "OH": "ohio", "OK": "oklahoma",
+    "OR": "oregon", "PA": "pennsylvania", "RI": "rhode-island", "SC": "south-carolina",
+    "SD": "south-dakota", "TN": "tennessee", "TX": "texas", "UT": "utah",
+    "VT": "vermont", "VA": "virginia", "WA": "washington", "WV": "west-virginia",
+    "WI": "wisconsin", "WY": "wyoming", "DC": "district-of-columbia"
+}
+
+
 class PeopleSearchAdapter:
     """Adapter for creating scraper jobs from people search site configs"""
     
@@ -36,30 +58,29 @@ class PeopleSearchAdapter:
         Returns:
             job_id (str)
         """
-        site_config = get_site_config(site_name)
-        search_config = site_config.get(search_type)
+        site = get_site_spec_by_id(resolve_site_id(site_name))
+        mode = site.mode(search_type)
         
-        if not search_config:
+        if not mode:
             raise ValueError(f"Search type '{search_type}' not supported by {site_name}")
         
-        # Build target URL
-        url_template = search_config["url_template"]
-        target_url = PeopleSearchAdapter._build_url(url_template, search_params)
+        # Build target URL (template precompiled at import)
+        target_url = mode.url_fn(PeopleSearchAdapter._url_values(search_params))
         
         # Extract field names
-        fields = list(search_config["fields"].keys())
+        fields = list(mode.fields)
         
         # Create job
         job = Job(
             id=uuid.uuid4(),
             target_url=target_url,
             fields=fields,
-            requires_auth=site_config.get("requires_auth", False),
+            requires_auth=site.requires_auth,
             frequency="on_demand",  # People search jobs are one-time
             strategy="auto",
-            crawl_mode=search_config.get("crawl_mode", "single"),
-            list_config=search_config.get("list_config", {}),
-            engine_mode=search_config.get("engine_mode", "auto"),
+            crawl_mode=mode.crawl_mode,
+            list_config=mode.list_config,
+            engine_mode=mode.engine_mode,
             status="validated"
         )
         
@@ -67,25 +88,15 @@ class PeopleSearchAdapter:
         db.flush()  # Get job.id
         
         # Create field mappings
-        for field_name, field_config in search_config["fields"].items():
-            selector_spec = {
-                "css": field_config.get("css", ""),
-                "attr": field_config.get("attr"),
-                "all": field_config.get("all", False)
-            }
-            
-            # Add regex if present
-            if field_config.get("regex"):
-                selector_spec["regex"] = field_config.get("regex")
-            
+        for field_name, field_spec in mode.fields.items():
             field_map = FieldMap(
                 id=uuid.uuid4(),
                 job_id=job.id,
                 field_name=field_name,
-                selector_spec=selector_spec,
-                field_type=field_config.get("field_type", "string"),
-                smart_config=field_config.get("smart_config", {}),
-                validation_rules=field_config.get("validation_rules", {})
+                selector_spec=field_spec.selector_spec(),
+                field_type=field_spec.field_type,
+                smart_config=dict(field_spec.smart_config or {}),  # shared across fields; copy per row
+                validation_rules=field_spec.validation_rules or {}
             )
             db.add(field_map)
         
@@ -96,62 +107,42 @@ class PeopleSearchAdapter:
     @staticmethod
     def _build_url(template: str, params: Dict[str, str]) -> str:
         """Build URL from template and parameters"""
-        url = template
-        
-        # Helper to convert state code to full name
-        state_names = {
-            "AL": "alabama", "AK": "alaska", "AZ": "arizona", "AR": "arkansas",
-            "CA": "california", "CO": "colorado", "CT": "connecticut", "DE": "delaware",
-            "FL": "florida", "GA": "georgia", "HI": "hawaii", "ID": "idaho",
-            "IL": "illinois", "IN": "indiana", "IA": "iowa", "KS": "kansas",
-            "KY": "kentucky", "LA": "louisiana", "ME": "maine", "MD": "maryland",
-            "MA": "massachusetts", "MI": "michigan", "MN": "minnesota", "MS": "mississippi",
-            "MO": "missouri", "MT": "montana", "NE": "nebraska", "NV": "nevada",
-            "NH": "new-hampshire", "NJ": "new-jersey", "NM": "new-mexico", "NY": "new-york",
-            "NC": "north-carolina", "ND": "north-dakota", "OH": "ohio", "OK": "oklahoma",
-            "OR": "oregon", "PA": "pennsylvania", "RI": "rhode-island", "SC": "south-carolina",
-            "SD": "south-dakota", "TN": "tennessee", "TX": "texas", "UT": "utah",
-            "VT": "vermont", "VA": "virginia", "WA": "washington", "WV": "west-virginia",
-            "WI": "wisconsin", "WY": "wyoming", "DC": "district-of-columbia"
-        }
+        return compile_url_template(template)(PeopleSearchAdapter._url_values(params))
+    
+    @staticmethod
+    def _url_values(params: Dict[str, str]) -> Dict[str, str]:
+        """Format search parameters into URL placeholder values"""
+        values = {}
         
         # Process all variants of each parameter
         for key, value in params.items():
             # Standard lowercase with dashes
-            placeholder = "{" + key + "}"
-            if placeholder in url:
-                if key == "name":
-                    # "John Smith" -> "john-smith"
-                    formatted = value.lower().replace(" ", "-")
-                    formatted = re.sub(r'[^a-z0-9-]', '', formatted)
-                elif key == "phone":
-                    # "+1-303-555-0100" -> "13035550100"
-                    formatted = re.sub(r'[^0-9]', '', value)
-                elif key in ("city", "state"):
-                    # "Dowagiac" -> "dowagiac", "MI" -> "mi"
-                    formatted = value.lower().replace(" ", "-")
-                    formatted = re.sub(r'[^a-z0-9-]', '', formatted)
-                elif key == "location":
-                    # "Denver, CO 80201" -> leave as-is
-                    formatted = value
-                else:
-                    formatted = value
-                
-                url = url.replace(placeholder, formatted)
+            if key == "name":
+                # "John Smith" -> "john-smith"
+                formatted = value.lower().replace(" ", "-")
+                formatted = re.sub(r'[^a-z0-9-]', '', formatted)
+            elif key == "phone":
+                # "+1-303-555-0100" -> "13035550100"
+                formatted = re.sub(r'[^0-9]', '', value)
+            elif key in ("city", "state"):
+                # "Dowagiac" -> "dowagiac", "MI" -> "mi"
+                formatted = value.lower().replace(" ", "-")
+                formatted = re.sub(r'[^a-z0-9-]', '', formatted)
+            elif key == "location":
+                # "Denver, CO 80201" -> leave as-is
+                formatted = value
+            else:
+                formatted = value
             
-            # State uppercase variant (for ThatsThem)
-            placeholder_upper = "{" + key + "_upper}"
-            if placeholder_upper in url and key == "state":
-                formatted = value.upper()
-                url = url.replace(placeholder_upper, formatted)
+            values[key] = formatted
             
-            # State full name variant (for ZabaSearch)
-            placeholder_full = "{" + key + "_full}"
-            if placeholder_full in url and key == "state":
-                formatted = state_names.get(value.upper(), value.lower())
-                url = url.replace(placeholder_full, formatted)
+            if key == "state":
+                # State uppercase variant (for ThatsThem)
+                values["state_upper"] = value.upper()
+                # State full name variant (for ZabaSearch)
+                values["state_full"] = STATE_NAMES.get(value.upper(), value.lower())
         
-        return url
+        return values
     
     @staticmethod
     def parse_search_results(
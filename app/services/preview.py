@@ -90,15 +90,15 @@ def validate_selector(url: str, selector_spec: Dict[str, Any], prefer_browser: b
     Validates a selector against a page and returns preview of extracted value.
     Used by UI to test selectors before saving to FieldMap.
     """
-    from app.scraping.extraction import extract_from_html_css
+    from app.scraping.extraction import extract_from_html_css, get_selector
     
     data = generate_preview(url, prefer_browser=prefer_browser)
     html = data["html_snippet"]
     via = data["fetched_via"]
 
-    # Estimate matches count using parsel
-    from parsel import Selector
-    sel = Selector(text=html)
+    # Estimate matches count using parsel (extract_from_html_css below
+    # reuses this parse)
+    sel = get_selector(html)
     css = selector_spec.get("css", "")
     count = len(sel.css(css)) if css else 0
 
@@ -9,10 +9,11 @@ Key behaviors:
 5. Auto-route to provider when sessions consistently fail
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import text, select, bindparam
 
 from app.models.session import SessionVault
 from app.models.domain_config import DomainConfig
@@ -21,6 +22,34 @@ from app.services.intervention_engine import InterventionEngine
 import httpx
 
 
+# Built once so every lookup reuses the same cached compiled form; only the
+# domain parameter changes between calls. uq_session_vaults_domain_valid
+# guarantees at most one match, so no ORDER BY/LIMIT is needed.
+_VALID_SESSION_STMT = (
+    select(SessionVault)
+    .where(
+        SessionVault.domain == bindparam("domain"),
+        SessionVault.is_valid == True,
+        SessionVault.health_status == SessionHealthStatus.VALID.value
+    )
+)
+
+_PROBE_RESULTS_PAGE_SIZE = 500
+
+_RECORD_PROBE_RESULTS_SQL = text("""
+    UPDATE session_vaults AS s
+    SET health_status = r.status,
+        is_valid = CASE WHEN r.attempt IS NULL THEN s.is_valid ELSE r.status = :valid END,
+        last_validated = CASE WHEN r.status = :valid THEN now() ELSE s.last_validated END,
+        validation_attempts = CASE
+            WHEN r.attempt IS NULL THEN s.validation_attempts
+            ELSE COALESCE(s.validation_attempts, '[]'::jsonb) || jsonb_build_array(r.attempt)
+        END
+    FROM json_to_recordset(CAST(:rows AS json)) AS r(id uuid, status text, attempt jsonb)
+    WHERE s.id = r.id
+""")
+
+
 class SessionManager:
     """Manages session health and lifecycle."""
     
@@ -32,14 +61,8 @@ class SessionManager:
         Returns:
             SessionVault if valid session found, None otherwise
         """
-        # Get most recently validated session
-        session = db.query(SessionVault).filter(
-            SessionVault.domain == domain,
-            SessionVault.is_valid == True,
-            SessionVault.health_status == SessionHealthStatus.VALID.value
-        ).order_by(SessionVault.last_validated.desc()).first()
-        
-        return session
+        # At most one valid session per domain (partial unique index)
+        return db.scalars(_VALID_SESSION_STMT, {"domain": domain}).first()
     
     @staticmethod
     async def probe_session(db: Session, session: SessionVault, probe_url: str) -> SessionHealthStatus:
@@ -79,15 +102,17 @@ class SessionManager:
             else:
                 status = SessionHealthStatus.UNKNOWN
             
-            # Update session
-            session.last_validated = datetime.utcnow()
+            # Update session; last_validated records successful validations
+            # only (a Python value, so reading it back needs no refresh)
+            if status == SessionHealthStatus.VALID:
+                session.last_validated = datetime.now(timezone.utc)
             session.health_status = status.value
             session.is_valid = (status == SessionHealthStatus.VALID)
             
             # Log validation attempt
             validation_attempts = session.validation_attempts or []
             validation_attempts.append({
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "status": status.value,
                 "response_code": response.status_code,
                 "probe_url": probe_url
@@ -109,12 +134,11 @@ class SessionManager:
         """Mark a session as invalid and log reason."""
         session.is_valid = False
         session.health_status = SessionHealthStatus.INVALID.value
-        session.last_validated = datetime.utcnow()
         
         # Log validation attempt
         validation_attempts = session.validation_attempts or []
         validation_attempts.append({
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "status": "invalid",
             "reason": reason
         })
@@ -122,6 +146,44 @@ class SessionManager:
         
         db.commit()
     
+    @staticmethod
+    def record_probe_results(db: Session, rows: List[Dict[str, Any]]) -> int:
+        """
+        Persist a batch of probe outcomes in one round-trip.
+        
+        Each row: {"id": <session id>, "status": "valid"|"invalid"|"unknown",
+                   "attempt": {...validation attempt entry...} or None}
+        
+        A None attempt (network error) only updates health_status, leaving
+        is_valid and the history untouched. last_validated is stamped only
+        for rows whose status is valid.
+        
+        The rows are shipped as one JSON document and joined server-side via
+        json_to_recordset, so N probes cost one UPDATE instead of N.
+        
+        Returns:
+            Number of rows updated
+        """
+        if not rows:
+            return 0
+        
+        # Page the batch so a huge probe run doesn't build one giant JSON
+        # parameter; all pages share one transaction
+        updated = 0
+        for start in range(0, len(rows), _PROBE_RESULTS_PAGE_SIZE):
+            payload = json.dumps([
+                {"id": str(r["id"]), "status": r["status"], "attempt": r["attempt"]}
+                for r in rows[start:start + _PROBE_RESULTS_PAGE_SIZE]
+            ])
+            result = db.execute(
+                _RECORD_PROBE_RESULTS_SQL,
+                {"rows": payload, "valid": SessionHealthStatus.VALID.value}
+            )
+            updated += result.rowcount
+        
+        db.commit()
+        return updated
+    
     @staticmethod
     def estimate_session_lifetime(db: Session, domain: str) -> Optional[int]:
         """
@@ -173,7 +235,7 @@ class SessionManager:
             return False
         
         refresh_threshold = session.expires_at - timedelta(days=buffer_days)
-        return datetime.utcnow() >= refresh_threshold
+        return datetime.now(timezone.utc) >= refresh_threshold
     
     @staticmethod
     def update_domain_stats(
@@ -11,9 +11,8 @@ Architecture:
 - Tracks probe results for learning
 """
 
-import asyncio
 import httpx
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
@@ -27,22 +26,16 @@ class SessionProbe:
     """Proactive session health checking."""
     
     @staticmethod
-    async def probe_session_health(
-        db: Session,
+    async def check_session_health(
         session: SessionVault,
         probe_url: str,
         timeout: float = 3.0
-    ) -> SessionHealthStatus:
+    ) -> tuple[SessionHealthStatus, Optional[int]]:
         """
-        Fast health check for a session.
-        
-        Args:
-            session: SessionVault to probe
-            probe_url: URL to test (homepage or search page)
-            timeout: Request timeout in seconds
+        Issue the HEAD probe for a session without touching the database.
         
         Returns:
-            SessionHealthStatus
+            (SessionHealthStatus, response_code or None on network error)
         """
         try:
             # Extract cookies
@@ -73,39 +66,61 @@ class SessionProbe:
             else:
                 status = SessionHealthStatus.UNKNOWN
             
-            # Update session
-            session.last_validated = datetime.utcnow()
-            session.health_status = status.value
-            session.is_valid = (status == SessionHealthStatus.VALID)
-            
-            # Log probe attempt
-            validation_attempts = session.validation_attempts or []
-            validation_attempts.append({
-                "timestamp": datetime.utcnow().isoformat(),
-                "status": status.value,
-                "response_code": response.status_code,
-                "probe_url": probe_url,
-                "method": "proactive_probe"
-            })
-            session.validation_attempts = validation_attempts
-            
+            return (status, response.status_code)
+        
+        except Exception:
+            # Timeout or network error - mark unknown, not invalid
+            return (SessionHealthStatus.UNKNOWN, None)
+    
+    @staticmethod
+    async def probe_session_health(
+        db: Session,
+        session: SessionVault,
+        probe_url: str,
+        timeout: float = 3.0
+    ) -> SessionHealthStatus:
+        """
+        Fast health check for a session.
+        
+        Args:
+            session: SessionVault to probe
+            probe_url: URL to test (homepage or search page)
+            timeout: Request timeout in seconds
+        
+        Returns:
+            SessionHealthStatus
+        """
+        status, response_code = await SessionProbe.check_session_health(
+            session, probe_url, timeout
+        )
+        
+        # Update session; last_validated records successful validations
+        # only (a Python value, so reading it back needs no refresh)
+        if status == SessionHealthStatus.VALID:
+            session.last_validated = datetime.now(timezone.utc)
+        session.health_status = status.value
+        
+        if response_code is None:
+            # Network error - leave validity and history untouched
             db.commit()
-            
             return status
         
-        except asyncio.TimeoutError:
-            # Timeout - mark unknown, not invalid
-            session.health_status = SessionHealthStatus.UNKNOWN.value
-            session.last_validated = datetime.utcnow()
-            db.commit()
-            return SessionHealthStatus.UNKNOWN
+        session.is_valid = (status == SessionHealthStatus.VALID)
         
-        except Exception as e:
-            # Network error - mark unknown
-            session.health_status = SessionHealthStatus.UNKNOWN.value
-            session.last_validated = datetime.utcnow()
-            db.commit()
-            return SessionHealthStatus.UNKNOWN
+        # Log probe attempt
+        validation_attempts = session.validation_attempts or []
+        validation_attempts.append({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "status": status.value,
+            "response_code": response_code,
+            "probe_url": probe_url,
+            "method": "proactive_probe"
+        })
+        session.validation_attempts = validation_attempts
+        
+        db.commit()
+        
+        return status
     
     @staticmethod
     async def probe_before_run(
@@ -213,13 +228,14 @@ class SessionProbe:
             return True
         
         # Probe if not validated in last hour
-        hour_ago = datetime.utcnow() - timedelta(hours=1)
+        now = datetime.now(timezone.utc)
+        hour_ago = now - timedelta(hours=1)
         if session.last_validated < hour_ago:
             return True
         
         # Probe if nearing expiration
         if session.expires_at:
-            days_until_expiry = (session.expires_at - datetime.utcnow()).days
+            days_until_expiry = (session.expires_at - now).days
             if days_until_expiry < 2:  # Less than 2 days left
                 return True
         
@@ -246,20 +262,37 @@ class SessionProbe:
         
         sessions = query.all()
         
-        probed = 0
+        # Probe over the network first, then persist the whole batch with
+        # one UPDATE instead of a commit per session
+        rows = []
         invalidated = 0
         
         for session in sessions:
             if SessionProbe.should_probe_session(session):
                 probe_url = f"https://{session.domain}"
-                status = await SessionProbe.probe_session_health(db, session, probe_url)
-                probed += 1
+                status, response_code = await SessionProbe.check_session_health(session, probe_url)
                 
                 if status == SessionHealthStatus.INVALID:
                     invalidated += 1
+                
+                rows.append({
+                    "id": session.id,
+                    "status": status.value,
+                    # Network errors only flip health_status, like probe_session_health
+                    "attempt": None if response_code is None else {
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "status": status.value,
+                        "response_code": response_code,
+                        "probe_url": probe_url,
+                        "method": "proactive_probe"
+                    }
+                })
+        
+        from app.services.session_manager import SessionManager
+        SessionManager.record_probe_results(db, rows)
         
         return {
             "sessions_checked": len(sessions),
-            "sessions_probed": probed,
+            "sessions_probed": len(rows),
             "sessions_invalidated": invalidated
         }
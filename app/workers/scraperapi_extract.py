@@ -10,7 +10,7 @@ import logging
 from urllib.parse import urljoin
 
 from app.config import settings
-from app.scraping.extraction import extract_from_html_css
+from app.scraping.extraction import compile_fields_extractor, compile_fields_plan, extract_from_html_css, get_selector
 from app.services.api_key_manager import ApiKeyManager
 
 logger = logging.getLogger(__name__)
@@ -44,14 +44,13 @@ def _extract_with_scraperapi(
     api_key, usage_record = key_result
     logger.info(f"ScraperAPI: Using key with {usage_record.remaining_credits}/{usage_record.total_credits} credits remaining")
     
+    # Compile the field map once; each page is parsed once for all fields
+    extract_page = compile_fields_extractor(compile_fields_plan(field_map))
+    
     def _extract_fields(html: str) -> Dict[str, Any]:
         """Extract all fields from HTML using field_map"""
-        item = {}
-        for field_name, spec in field_map.items():
-            value = extract_from_html_css(html, spec)
-            if value is not None:
-                item[field_name] = value
-        return item
+        values = extract_page(get_selector(html))
+        return {name: value for name, value in values.items() if value is not None}
     
     def _make_request(target_url: str) -> Optional[str]:
         """Make a ScraperAPI request and track usage."""
@@ -57,8 +57,16 @@ from app.services.session_manager import SessionManager
 from app.models.domain_config import DomainConfig
 from app.services.orchestrator import pause_run_for_intervention
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Scrapy subprocess handoff files live on tmpfs where there is one
+_SCRAPY_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 def _db() -> Session:
     return SessionLocal()
@@ -210,42 +218,57 @@ def _scrapy_extract(start_url: str, field_map: Dict[str, Any], crawl_mode: str =
     }
     
     try:
-        # Run Scrapy in isolated subprocess
-        result = subprocess.run(
-            [sys.executable, script_path, json.dumps(args)],
-            capture_output=True,
-            text=True,
-            timeout=settings.http_timeout_seconds + 10,  # Add buffer for subprocess overhead
-            check=False
-        )
-        
-        if result.returncode != 0:
-            logger.error(f"Scrapy subprocess failed: {result.stderr}")
-            return []
-        
-        # Parse JSON output
-        output = result.stdout.strip()
-        if not output:
-            return []
-        
-        data = json.loads(output)
-        if not data.get("success"):
-            logger.error(f"Scrapy extraction failed: {data.get('error', 'Unknown error')}")
-            return []
-        
-        return data.get("items", [])
+        # Arguments and items go through files, not argv/stdout
+        with tempfile.TemporaryDirectory(dir=_SCRAPY_TMP_DIR) as tmpdir:
+            args_path = os.path.join(tmpdir, "args.json")
+            out_path = os.path.join(tmpdir, "items.jsonl")
+            with open(args_path, "w", encoding="utf-8") as f:
+                json.dump(args, f)
+            
+            # Run Scrapy in isolated subprocess
+            result = subprocess.run(
+                [sys.executable, script_path, args_path, out_path],
+                capture_output=True,
+                text=True,
+                timeout=settings.http_timeout_seconds + 10,  # Add buffer for subprocess overhead
+                check=False
+            )
+            
+            if result.returncode != 0:
+                logger.error(f"Scrapy subprocess failed: {result.stdout.strip() or result.stderr}")
+                return []
+            
+            if not os.path.exists(out_path):
+                return []
+            return _read_jsonl(out_path)
         
     except subprocess.TimeoutExpired:
         logger.error(f"Scrapy subprocess timed out after {settings.http_timeout_seconds + 10}s")
         return []
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse Scrapy output: {e}, stdout: {result.stdout[:500]}")
+        logger.error(f"Failed to parse Scrapy output: {e}")
         return []
     except Exception as e:
         logger.error(f"Error running Scrapy subprocess: {e}")
         return []
 
 
+def _read_jsonl(path: str) -> List[Dict[str, Any]]:
+    """Items from a JSON Lines feed, one per line."""
+    items = []
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                items.append(_json_loads(line))
+            except ValueError:
+                # orjson rejects NaN/Infinity, which Scrapy's encoder emits
+                items.append(json.loads(line))
+    return items
+
+
 @celery_app.task(bind=True, name="runs.execute", autoretry_for=(), retry_backoff=False)
 def execute_run(self: Task, run_id: str) -> None:
     """
@@ -706,7 +729,7 @@ def execute_run(self: Task, run_id: str) -> None:
                 # Check if we can escalate on error
                 if escalation.can_escalate(current_engine):
                     # Try next tier
-                    tier_idx = escalation.TIER_ORDER.index(current_engine)
+                    tier_idx = escalation.TIER_INDEX[current_engine]
                     current_engine = escalation.TIER_ORDER[tier_idx + 1]
                     escalation_count += 1
                 else:
@@ -887,7 +910,7 @@ def _extract_with_scrapingbee(
     Supports both single-page and list crawling modes.
     """
     from app.config import settings
-    from app.scraping.extraction import extract_from_html_css
+    from app.scraping.extraction import compile_fields_extractor, compile_fields_plan, extract_from_html_css, get_selector
     from urllib.parse import urljoin
     
     logger.info(f"ScrapingBee: Starting extraction for {url}, mode={crawl_mode}")
@@ -899,14 +922,13 @@ def _extract_with_scrapingbee(
     logger.info(f"ScrapingBee: API key configured (length={len(settings.scrapingbee_api_key)})")
     scrapingbee_url = "https://app.scrapingbee.com/api/v1/"
     
+    # Compile the field map once; each page is parsed once for all fields
+    extract_page = compile_fields_extractor(compile_fields_plan(field_map))
+    
     def _extract_fields(html: str) -> Dict[str, Any]:
         """Extract all fields from HTML using field_map"""
-        item = {}
-        for field_name, spec in field_map.items():
-            value = extract_from_html_css(html, spec)
-            if value is not None:
-                item[field_name] = value
-        return item
+        values = extract_page(get_selector(html))
+        return {name: value for name, value in values.items() if value is not None}
     
     if crawl_mode == "list":
         # List mode: extract list items and optionally paginate
@@ -19,9 +19,11 @@ fi
 echo "📦 Database: $DATABASE_URL"
 echo ""
 
-# Run migration
-echo "🔄 Running migration..."
-psql "$DATABASE_URL" -f migrations/001_hitl_pause_architecture.sql
+# Run migrations in order (each file is idempotent)
+for migration in migrations/*.sql; do
+    echo "🔄 Running $migration..."
+    psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f "$migration"
+done
 
 echo ""
 echo "✅ Migrations complete!"